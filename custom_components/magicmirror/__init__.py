@@ -11,6 +11,7 @@ from homeassistant.const import (
     Platform,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import discovery
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
@@ -18,17 +19,46 @@ from homeassistant.helpers.typing import ConfigType
 
 from custom_components.magicmirror.api import MagicMirrorApiClient
 from custom_components.magicmirror.const import (
+    ATTR_BROADCAST,
     ATTR_CONFIG_ENTRY_ID,
+    CONF_DEDICATED_SESSION,
+    CONF_PUSH,
+    CONF_SOCKET,
     DATA_HASS_CONFIG,
+    DATA_SCHEDULER,
     DOMAIN,
     PLATFORMS,
 )
-from custom_components.magicmirror.coordinator import MagicMirrorDataUpdateCoordinator
+from custom_components.magicmirror.coordinator import (
+    MagicMirrorDataUpdateCoordinator,
+    MagicMirrorRuntimeData,
+    MagicMirrorUpdateCoordinator,
+)
+from custom_components.magicmirror.notification_queue import (
+    MagicMirrorNotificationQueue,
+)
+from custom_components.magicmirror.push import async_setup_push
+from custom_components.magicmirror.scheduler import MagicMirrorFleetScheduler
+from custom_components.magicmirror.services import async_setup_services
+from custom_components.magicmirror.storage import MagicMirrorSnapshot
+from custom_components.magicmirror.transport import MagicMirrorSocketTransport
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the MagicMirror component."""
     hass.data[DATA_HASS_CONFIG] = config
+    async_setup_services(hass)
+
+    # One notify service reaching all mirrors, next to the per-mirror ones
+    hass.async_create_task(
+        discovery.async_load_platform(
+            hass,
+            Platform.NOTIFY,
+            DOMAIN,
+            {CONF_NAME: f"{DOMAIN}_all", ATTR_BROADCAST: True},
+            config,
+        )
+    )
     return True
 
 
@@ -42,6 +72,10 @@ async def async_remove_config_entry_device(
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up MagicMirror from a config entry."""
     hass.data.setdefault(DOMAIN, {})
+    # Shared by all entries, keyed apart from the entry ids
+    scheduler: MagicMirrorFleetScheduler = hass.data[DOMAIN].setdefault(
+        DATA_SCHEDULER, MagicMirrorFleetScheduler()
+    )
 
     api = MagicMirrorApiClient(
         host=entry.data[CONF_HOST],
@@ -50,12 +84,57 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         session=async_get_clientsession(hass),
     )
 
+    if entry.options.get(CONF_DEDICATED_SESSION, False):
+        api.create_session()
+
+    if entry.options.get(CONF_SOCKET, False):
+        api.transport = MagicMirrorSocketTransport(hass, api.session, api.base_url)
+
     name = entry.data.get(CONF_NAME, "MagicMirror")
-    coordinator = MagicMirrorDataUpdateCoordinator(hass, api, name)
+    coordinator = MagicMirrorDataUpdateCoordinator(
+        hass,
+        api,
+        name,
+        entry.options,
+        scheduler=scheduler,
+    )
+    update_coordinator = MagicMirrorUpdateCoordinator(hass, api, name, scheduler)
+
+    snapshot = MagicMirrorSnapshot(hass, entry.entry_id)
+    if (restored := await snapshot.async_load()) is not None:
+        # Create the entities from the last known state, and poll in the background
+        data, update_data = restored
+        coordinator.async_restore(data)
+        if update_data is not None:
+            update_coordinator.async_restore(update_data)
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} {name} refresh"
+        )
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryNotReady:
+            await api.async_close()
+            raise
+
+    # The update checks make the mirror run git, so they never block setup.
+    # Update entities are added once the first check finished.
+    entry.async_create_background_task(
+        hass, update_coordinator.async_refresh(), f"{DOMAIN} {name} update check"
+    )
 
-    await coordinator.async_config_entry_first_refresh()
+    entry.async_on_unload(snapshot.async_track(coordinator, update_coordinator))
 
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    hass.data[DOMAIN][entry.entry_id] = MagicMirrorRuntimeData(
+        coordinator=coordinator,
+        update_coordinator=update_coordinator,
+        notifications=MagicMirrorNotificationQueue(hass, api),
+    )
+
+    if entry.options.get(CONF_PUSH, False):
+        await async_setup_push(hass, entry, coordinator)
+
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -86,12 +165,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        runtime_data: MagicMirrorRuntimeData = hass.data[DOMAIN].pop(entry.entry_id)
+        await runtime_data.notifications.async_close()
+        await runtime_data.coordinator.api.async_close()
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted state of a removed config entry."""
+    await MagicMirrorSnapshot(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    await hass.config_entries.async_reload(entry.entry_id)
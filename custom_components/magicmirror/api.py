@@ -1,11 +1,30 @@
 """MagicMirror API."""
 
+import asyncio
+import hashlib
+import json
+import random
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable
 from http import HTTPStatus
-from typing import Any
+from typing import Any, TypeVar
+from urllib.parse import urlencode
 
 import aiohttp
+import attr
+from aiohttp import hdrs
 
+from custom_components.magicmirror.circuit_breaker import (
+    CircuitBreaker,
+    MagicMirrorCircuitOpenError,
+)
 from custom_components.magicmirror.const import LOGGER
+from custom_components.magicmirror.metrics import (
+    REQUEST_TRACE_SIZE,
+    RequestMetrics,
+    RequestTrace,
+)
 from custom_components.magicmirror.models import (
     GenericResponse,
     ModuleResponse,
@@ -13,6 +32,7 @@ from custom_components.magicmirror.models import (
     MonitorResponse,
     QueryResponse,
 )
+from custom_components.magicmirror.transport import MagicMirrorSocketTransport
 
 # Mirror control
 API_TEST = "api/test"
@@ -46,6 +66,114 @@ API_CONFIG = "api/config"
 
 SWAGGER = "/api/docs/#/"
 
+# Timeout budgets in seconds, matched by path prefix in order
+DEFAULT_TIMEOUT = 10
+ENDPOINT_TIMEOUTS = {
+    API_MONITOR: 5,
+    API_BRIGHTNESS: 5,
+    API_MM_UPDATE_AVAILABLE: 60,
+    API_UPDATE_AVAILABLE: 120,
+    API_UPDATE_MODULE: 300,
+    API_MODULE: 10,
+}
+# Connecting gets a short budget of its own, so a dead host fails fast
+CONNECT_TIMEOUT = 5
+
+RETRIES = 2
+RETRY_BASE_DELAY = 0.5
+
+# Alerts with longer messages are posted instead of sent in the query string
+ALERT_MAX_QUERY_MESSAGE = 200
+
+# Payloads larger than this many bytes are decoded in an executor thread
+EXECUTOR_DECODE_THRESHOLD = 64 * 1024
+
+# Dedicated session tuning
+SESSION_CONNECTION_LIMIT = 4
+SESSION_DNS_CACHE_TTL = 300
+SESSION_KEEPALIVE_TIMEOUT = 60
+
+
+_T = TypeVar("_T")
+
+
+def _decode(body: bytes, decoder: Callable[[Any], _T]) -> tuple[_T, float]:
+    """Parse and decode a payload, returning it and how long that took."""
+    start = time.monotonic()
+    decoded = decoder(json.loads(body))
+    return decoded, time.monotonic() - start
+
+
+@attr.s(auto_attribs=True)
+class RawResponse:
+    """Class representing a raw HTTP response."""
+
+    status: int
+    body: bytes | None
+    etag: str | None
+
+
+@attr.s(auto_attribs=True)
+class CachedPayload:
+    """Class representing the last decoded payload of an endpoint."""
+
+    fingerprint: bytes
+    etag: str | None
+    decoded: Any
+
+
+@attr.s(auto_attribs=True)
+class CommandLatency:
+    """Class representing command latency for a transport."""
+
+    count: int = 0
+    total: float = 0.0
+    last: float | None = None
+
+    @property
+    def average(self) -> float | None:
+        """Return the average latency in seconds."""
+        return self.total / self.count if self.count else None
+
+
+@attr.s(auto_attribs=True)
+class RetryStats:
+    """Class representing how often retries rescue a request."""
+
+    attempts: int = 0
+    rescued: int = 0
+    exhausted: int = 0
+
+
+@attr.s(auto_attribs=True)
+class ConnectionStats:
+    """Class representing connections created and reused by a session."""
+
+    created: int = 0
+    reused: int = 0
+
+
+@attr.s(auto_attribs=True)
+class PayloadCacheStats:
+    """Class representing payload cache hits and misses."""
+
+    hits: int = 0
+    misses: int = 0
+
+
+@attr.s(auto_attribs=True)
+class DecodeStats:
+    """Class representing where payloads were decoded."""
+
+    inline: int = 0
+    offloaded: int = 0
+    # Time the event loop was blocked decoding
+    inline_last: float | None = None
+    inline_max: float = 0.0
+    # Time decoding took in the executor, sparing the event loop
+    offloaded_last: float | None = None
+    offloaded_max: float = 0.0
+
 
 class MagicMirrorApiClient:
     """Main class for handling connection with."""
@@ -56,20 +184,80 @@ class MagicMirrorApiClient:
         port: str,
         api_key: str,
         session: aiohttp.client.ClientSession | None = None,
+        transport: MagicMirrorSocketTransport | None = None,
     ) -> None:
         """Initialize connection with MagicMirror."""
         self.host = host
         self.port = port
         self.api_key = api_key
         self._session = session
+        self._owns_session = False
+        self.transport = transport
 
         self.base_url = f"http://{self.host}:{self.port}"
+        self.breaker = CircuitBreaker(self.base_url)
         self.headers = {
             "accept": "application/json",
             "Authorization": f"Bearer {self.api_key}",
         }
 
-    async def handle_request(self, response) -> Any:
+        self._payload_cache: dict[str, CachedPayload] = {}
+        self.payload_stats = PayloadCacheStats()
+        self.decode_stats = DecodeStats()
+        self.endpoint_metrics: defaultdict[str, RequestMetrics] = defaultdict(
+            RequestMetrics
+        )
+        self.traces: deque[RequestTrace] = deque(maxlen=REQUEST_TRACE_SIZE)
+        self.retry_stats = RetryStats()
+        self.connection_stats: ConnectionStats | None = None
+        self.command_latency = {"socket": CommandLatency(), "http": CommandLatency()}
+
+        self._brightness_lock = asyncio.Lock()
+        self._brightness_target: int | None = None
+        self._brightness_pending: asyncio.Future[GenericResponse] | None = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession | None:
+        """Return the session used by this client."""
+        return self._session
+
+    def create_session(self) -> aiohttp.ClientSession:
+        """Create a dedicated session for this mirror, counting its connections."""
+        self.connection_stats = ConnectionStats()
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_create)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuse)
+
+        # Keep connections alive across a poll cycle and ask for gzip bodies
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=SESSION_CONNECTION_LIMIT,
+                ttl_dns_cache=SESSION_DNS_CACHE_TTL,
+                keepalive_timeout=SESSION_KEEPALIVE_TIMEOUT,
+            ),
+            headers={hdrs.ACCEPT_ENCODING: "gzip, deflate"},
+            trace_configs=[trace_config],
+        )
+        self._owns_session = True
+        return self._session
+
+    async def _on_connection_create(self, *_: Any) -> None:
+        """Count a new connection."""
+        self.connection_stats.created += 1
+
+    async def _on_connection_reuse(self, *_: Any) -> None:
+        """Count a reused connection."""
+        self.connection_stats.reused += 1
+
+    async def async_close(self) -> None:
+        """Close the socket transport, and the session if it is dedicated."""
+        if self.transport is not None:
+            await self.transport.async_close()
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+
+    async def handle_request(self, response) -> RawResponse:
         """Handle request."""
         LOGGER.debug("pre handle_request=%s", response)
 
@@ -78,72 +266,263 @@ class MagicMirrorApiClient:
                 exception = f"Forbidden {resp}. Check for missing API-key."
                 raise Exception(exception)
 
+            if resp.status == HTTPStatus.NOT_MODIFIED:
+                return RawResponse(status=resp.status, body=None, etag=None)
+
             if resp.status != HTTPStatus.OK:
                 LOGGER.warning("Response not 200 OK %s", resp)
-                data = None
-            else:
-                data = await resp.json()
-                LOGGER.debug("post handle_request=%s", data)
+                return RawResponse(status=resp.status, body=None, etag=None)
 
-        return data
+            body = await resp.read()
+            LOGGER.debug("post handle_request=%s", body)
 
-    async def get(self, path: str) -> Any:
-        """Get request."""
-        get_url = f"{self.base_url}/{path}"
-        LOGGER.debug("GET url=%s. headers=%s", get_url, self.headers)
+            return RawResponse(
+                status=resp.status, body=body, etag=resp.headers.get(hdrs.ETAG)
+            )
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        headers: dict[str, str] | None = None,
+        data: str | None = None,
+        retries: int = 0,
+    ) -> RawResponse | None:
+        """Send a request and read the raw response."""
+        LOGGER.debug("%s path=%s. data=%s", method, path, data)
 
         if self._session is None:
             LOGGER.warning("There is no session")
             return None
 
-        get = await self._session.get(
-            url=get_url,
-            headers=self.headers,
+        endpoint = self.endpoint_for(path)
+        start = time.monotonic()
+        try:
+            response = await self.send(
+                method, path, headers or self.headers, data, retries=retries
+            )
+            LOGGER.debug("Response=%s", response)
+            raw = await self.handle_request(response)
+        except MagicMirrorCircuitOpenError:
+            raise
+        except Exception as error:
+            self._record_request(endpoint, method, start, error=error)
+            raise
+
+        self._record_request(endpoint, method, start, raw=raw)
+        return raw
+
+    def _record_request(
+        self,
+        endpoint: str,
+        method: str,
+        start: float,
+        raw: RawResponse | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        """Record the metrics and trace of a finished request."""
+        duration = time.monotonic() - start
+        metrics = self.endpoint_metrics[endpoint]
+        size = len(raw.body) if raw is not None and raw.body is not None else None
+
+        if error is not None:
+            metrics.record_error(duration, timeout=isinstance(error, TimeoutError))
+        elif raw.status in (HTTPStatus.OK, HTTPStatus.NOT_MODIFIED):
+            metrics.record(duration, size)
+        else:
+            metrics.record_error(duration)
+
+        self.traces.append(
+            RequestTrace(
+                endpoint=endpoint,
+                method=method,
+                start=time.time() - duration,
+                duration=duration,
+                status=raw.status if raw is not None else None,
+                size=size,
+                error=(str(error) or type(error).__name__) if error else None,
+            )
         )
 
-        LOGGER.debug("Response=%s", get)
+    async def send(
+        self,
+        method: str,
+        path: str,
+        headers: dict[str, str],
+        data: str | None = None,
+        retries: int = 0,
+    ) -> aiohttp.ClientResponse:
+        """Send a request through the circuit breaker, retrying only when asked to."""
+        # Fails fast without touching the network while the mirror is unreachable
+        self.breaker.before_request()
+
+        url = f"{self.base_url}/{path}"
+        timeout = aiohttp.ClientTimeout(
+            total=self.timeout_for(path), sock_connect=CONNECT_TIMEOUT
+        )
+        attempt = 0
+
+        while True:
+            try:
+                response = await self._session.request(
+                    method,
+                    url=url,
+                    headers=headers,
+                    data=data,
+                    timeout=timeout,
+                )
+            except (aiohttp.ClientConnectionError, TimeoutError) as error:
+                # Only idempotent requests pass retries, retried with jitter
+                if attempt >= retries:
+                    self.breaker.record_failure()
+                    if attempt:
+                        self.retry_stats.exhausted += 1
+                    raise
+
+                attempt += 1
+                self.retry_stats.attempts += 1
+                delay = random.uniform(0, RETRY_BASE_DELAY * 2**attempt)  # noqa: S311
+                LOGGER.debug("Retrying %s in %.2f s: %s", path, delay, error)
+                await asyncio.sleep(delay)
+                continue
+
+            if attempt:
+                self.retry_stats.rescued += 1
+            self.breaker.record_success()
+            return response
+
+    @staticmethod
+    def endpoint_for(path: str) -> str:
+        """Return the endpoint of a path, without query and arguments."""
+        path = path.partition("?")[0]
+        if path.startswith(f"{API_BRIGHTNESS}/"):
+            return f"{API_BRIGHTNESS}/{{value}}"
+        if path.startswith(f"{API_MODULE}/") and path not in (
+            API_MODULE_INSTALLED,
+            API_MODULE_AVAILABLE,
+        ):
+            return f"{API_MODULE}/{{module}}/{path.rsplit('/', 1)[-1]}"
+        return path
+
+    @staticmethod
+    def timeout_for(path: str) -> int:
+        """Return the timeout budget for an endpoint."""
+        for prefix, budget in ENDPOINT_TIMEOUTS.items():
+            if path.startswith(prefix):
+                return budget
+        return DEFAULT_TIMEOUT
+
+    async def get(self, path: str) -> Any:
+        """Get request."""
+        raw = await self.request(hdrs.METH_GET, path)
+        if raw is None or raw.body is None:
+            return None
+        return json.loads(raw.body)
+
+    async def get_decoded(self, path: str, decoder: Callable[[Any], _T]) -> _T:
+        """Get request, reusing the decoded model when the payload is unchanged."""
+        # Unchanged payloads are detected by ETag or by a fingerprint of the body
+        cached = self._payload_cache.get(path)
+        headers = self.headers
+        if cached is not None and cached.etag is not None:
+            headers = {**self.headers, hdrs.IF_NONE_MATCH: cached.etag}
+
+        raw = await self.request(hdrs.METH_GET, path, headers=headers, retries=RETRIES)
+
+        if raw is not None and raw.status == HTTPStatus.NOT_MODIFIED and cached:
+            self.payload_stats.hits += 1
+            return cached.decoded
+
+        if raw is None or raw.body is None:
+            return decoder(None)
+
+        fingerprint = hashlib.blake2b(raw.body, digest_size=16).digest()
+        if cached is not None and cached.fingerprint == fingerprint:
+            cached.etag = raw.etag
+            self.payload_stats.hits += 1
+            return cached.decoded
+
+        self.payload_stats.misses += 1
+        decoded = await self.decode(raw.body, decoder)
+        self._payload_cache[path] = CachedPayload(
+            fingerprint=fingerprint, etag=raw.etag, decoded=decoded
+        )
+        return decoded
+
+    async def decode(self, body: bytes, decoder: Callable[[Any], _T]) -> _T:
+        """Parse and decode a payload, off the event loop if it is large."""
+        stats = self.decode_stats
+        if len(body) > EXECUTOR_DECODE_THRESHOLD:
+            decoded, duration = await asyncio.get_running_loop().run_in_executor(
+                None, _decode, body, decoder
+            )
+            stats.offloaded += 1
+            stats.offloaded_last = duration
+            stats.offloaded_max = max(stats.offloaded_max, duration)
+            return decoded
+
+        decoded, duration = _decode(body, decoder)
+        stats.inline += 1
+        stats.inline_last = duration
+        stats.inline_max = max(stats.inline_max, duration)
+        return decoded
+
+    async def command(
+        self, action: str, path: str, payload: dict[str, Any] | None = None
+    ) -> Any:
+        """Send a command over the socket transport, falling back to HTTP."""
+        start = time.monotonic()
+
+        if self.transport is not None:
+            # The module's reply has the same shape as over HTTP
+            reply = await self.transport.async_send(action, payload or {})
+            if reply:
+                self._record_command_latency("socket", start)
+                return reply
+            if reply is not None:
+                # Sent without a reply in time. Resending over HTTP could run
+                # the command twice, so it is taken as accepted and left for
+                # the next poll to verify.
+                return {"success": True}
+
+        data = await self.get(path)
+        self._record_command_latency("http", start)
+        return data
 
-        return await self.handle_request(get)
+    def _record_command_latency(self, transport: str, start: float) -> None:
+        """Record the latency of a command."""
+        latency = self.command_latency[transport]
+        latency.last = time.monotonic() - start
+        latency.count += 1
+        latency.total += latency.last
 
     async def system_call(self, path: str) -> None:
         """Get request."""
         get_url = f"{self.base_url}/{path}"
-        LOGGER.debug("GET url=%s. headers=%s", get_url, self.headers)
+        LOGGER.debug("GET url=%s", get_url)
 
         if self._session is None:
             LOGGER.warning("There is no session")
             return
 
         try:
-            await self._session.get(
-                url=get_url,
-                headers=self.headers,
-            )
+            response = await self.send(hdrs.METH_GET, path, self.headers)
+            response.release()
         except (aiohttp.ClientConnectionError, aiohttp.ServerDisconnectedError) as e:
             LOGGER.error(
                 "Connection error: %s. Check if the MagicMirror service is running.", e
             )
+        except MagicMirrorCircuitOpenError as e:
+            LOGGER.error("%s", e)
 
-    async def post(self, path: str, data: str | None = None) -> Any:
+    async def post(
+        self, path: str, data: str | None = None, headers: dict[str, str] | None = None
+    ) -> Any:
         """Post request."""
-        post_url = f"{self.base_url}/{path}"
-        LOGGER.debug("POST url=%s. data=%s. headers=%s", post_url, data, self.headers)
-
-        if self._session is None:
-            LOGGER.warning("There is no session")
+        raw = await self.request(hdrs.METH_POST, path, headers=headers, data=data)
+        if raw is None or raw.body is None:
             return None
-
-        post = (
-            await self._session.post(
-                url=post_url,
-                headers=self.headers,
-                data=data,
-            ),
-        )
-
-        LOGGER.debug("Response=%s", post)
-
-        return await self.handle_request(post)
+        return json.loads(raw.body)
 
     async def api_test(self) -> GenericResponse:
         """Test api."""
@@ -151,30 +530,33 @@ class MagicMirrorApiClient:
 
     async def mm_update_available(self) -> QueryResponse:
         """Get update available status."""
-        return QueryResponse.from_dict(await self.get(API_MM_UPDATE_AVAILABLE))
+        return await self.get_decoded(API_MM_UPDATE_AVAILABLE, QueryResponse.from_dict)
 
     async def update_available(self) -> ModuleUpdateResponses:
         """Get update available status."""
-        response = await self.get(API_UPDATE_AVAILABLE)
-        if response is None:
-            return ModuleUpdateResponses(success=False, result=[])
-        return ModuleUpdateResponses.from_dict(response)
+        return await self.get_decoded(
+            API_UPDATE_AVAILABLE, ModuleUpdateResponses.from_dict
+        )
 
     async def monitor_status(self) -> MonitorResponse:
         """Get monitor status."""
-        return MonitorResponse.from_dict(await self.get(API_MONITOR_STATUS))
+        return await self.get_decoded(API_MONITOR_STATUS, MonitorResponse.from_dict)
 
     async def get_modules(self) -> ModuleResponse:
         """Get module status."""
-        return ModuleResponse.from_dict(await self.get(API_MODULE))
+        return await self.get_decoded(API_MODULE, ModuleResponse.from_dict)
 
-    async def monitor_on(self) -> Any:
+    async def monitor_on(self) -> MonitorResponse:
         """Turn on monitor."""
-        return MonitorResponse.from_dict(await self.get(API_MONITOR_ON))
+        return MonitorResponse.from_dict(
+            await self.command("MONITORON", API_MONITOR_ON) or {}
+        )
 
-    async def monitor_off(self) -> Any:
+    async def monitor_off(self) -> MonitorResponse:
         """Turn off monitor."""
-        return MonitorResponse.from_dict(await self.get(API_MONITOR_OFF))
+        return MonitorResponse.from_dict(
+            await self.command("MONITOROFF", API_MONITOR_OFF) or {}
+        )
 
     async def monitor_toggle(self) -> Any:
         """Toggle monitor."""
@@ -208,13 +590,47 @@ class MagicMirrorApiClient:
         """Devtools."""
         return await self.get(API_DEVTOOLS)
 
-    async def brightness(self, brightness: str) -> Any:
+    async def brightness(self, brightness: str) -> GenericResponse:
         """Brightness."""
-        return await self.get(f"{API_BRIGHTNESS}/{brightness}")
+        return GenericResponse.from_dict(
+            await self.command(
+                "BRIGHTNESS",
+                f"{API_BRIGHTNESS}/{brightness}",
+                {"value": int(brightness)},
+            )
+            or {}
+        )
+
+    async def set_brightness(self, brightness: int) -> GenericResponse:
+        """Set brightness, coalescing rapid updates."""
+        # At most one request is in flight, values set meanwhile replace each
+        # other and share the outcome of the request sending the newest one
+        self._brightness_target = brightness
+        if self._brightness_pending is None:
+            self._brightness_pending = asyncio.get_running_loop().create_future()
+        pending = self._brightness_pending
+
+        async with self._brightness_lock:
+            if pending.done():
+                return pending.result()
+
+            # A cancelled send leaves pending unresolved, so a caller waiting
+            # on it sends the value itself
+            self._brightness_pending = None
+            try:
+                response = await self.brightness(str(self._brightness_target))
+            except Exception as error:
+                pending.set_exception(error)
+                # Retrieved here, as there may be no other caller to raise it
+                pending.exception()
+                raise
+
+            pending.set_result(response)
+            return response
 
     async def get_brightness(self) -> QueryResponse:
         """Brightness."""
-        return QueryResponse.from_dict(await self.get(API_BRIGHTNESS))
+        return await self.get_decoded(API_BRIGHTNESS, QueryResponse.from_dict)
 
     async def module(self, module_name: str) -> Any:
         """Endpoint for module."""
@@ -248,13 +664,23 @@ class MagicMirrorApiClient:
         """Config."""
         return await self.get(API_CONFIG)
 
-    async def show_module(self, module) -> Any:
+    async def show_module(self, module) -> GenericResponse:
         """Show module."""
-        return await self.get(f"{API_MODULE}/{module}/show")
+        return GenericResponse.from_dict(
+            await self.command(
+                "SHOW", f"{API_MODULE}/{module}/show", {"module": module}
+            )
+            or {}
+        )
 
-    async def hide_module(self, module) -> Any:
+    async def hide_module(self, module) -> GenericResponse:
         """Hide module."""
-        return await self.get(f"{API_MODULE}/{module}/hide")
+        return GenericResponse.from_dict(
+            await self.command(
+                "HIDE", f"{API_MODULE}/{module}/hide", {"module": module}
+            )
+            or {}
+        )
 
     async def alert(
         self,
@@ -264,8 +690,16 @@ class MagicMirrorApiClient:
         dropdown: bool = False,
     ) -> Any:
         """Notification screen."""
-        alert = "&type=notification" if dropdown else ""
+        path = f"{API_MODULE}/alert/showalert"
+        params = {"title": title, "message": msg, "timer": timer}
+        if dropdown:
+            params["type"] = "notification"
+
+        if len(msg) > ALERT_MAX_QUERY_MESSAGE:
+            return await self.post(
+                path,
+                json.dumps(params),
+                {**self.headers, hdrs.CONTENT_TYPE: "application/json"},
+            )
 
-        return await self.get(
-            f"{API_MODULE}/alert/showalert?title={title}&message={msg}&timer={timer}{alert}"
-        )
+        return await self.get(f"{path}?{urlencode(params)}")
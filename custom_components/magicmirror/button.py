@@ -8,10 +8,13 @@ from homeassistant.components.button import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from custom_components.magicmirror.const import DOMAIN
-from custom_components.magicmirror.coordinator import MagicMirrorDataUpdateCoordinator
+from custom_components.magicmirror.coordinator import (
+    MagicMirrorDataUpdateCoordinator,
+    MagicMirrorRuntimeData,
+)
+from custom_components.magicmirror.entity import MagicMirrorEntity
 from custom_components.magicmirror.models import Entity
 
 
@@ -21,7 +24,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Add MagicMirror entities from a config_entry."""
-    coordinator: MagicMirrorDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    runtime_data: MagicMirrorRuntimeData = hass.data[DOMAIN][entry.entry_id]
+    coordinator = runtime_data.coordinator
 
     async_add_entities(
         [
@@ -63,7 +67,7 @@ async def async_setup_entry(
     )
 
 
-class MagicMirrorButton(CoordinatorEntity, ButtonEntity):
+class MagicMirrorButton(MagicMirrorEntity, ButtonEntity):
     """Define a MagicMirror entity."""
 
     coordinator: MagicMirrorDataUpdateCoordinator
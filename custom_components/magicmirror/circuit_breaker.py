@@ -0,0 +1,114 @@
+"""Circuit breaker for MagicMirror."""
+
+from __future__ import annotations
+
+import time
+from enum import StrEnum
+
+from custom_components.magicmirror.const import LOGGER
+
+FAILURE_THRESHOLD = 3
+BASE_DELAY = 30.0
+MAX_DELAY = 900.0
+TRIAL_TIMEOUT = 60.0
+
+
+class CircuitState(StrEnum):
+    """Enum for storing circuit breaker state."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class MagicMirrorCircuitOpenError(Exception):
+    """Raised when a request is rejected because the mirror is unreachable."""
+
+    def __init__(self, name: str, retry_in: float) -> None:
+        """Initialize error."""
+        super().__init__(f"{name} is unreachable, retrying in {retry_in:.0f} s")
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Fail fast while a mirror is unreachable, with exponential backoff."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize circuit breaker."""
+        self.name = name
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.delay = BASE_DELAY
+        self.opened_count = 0
+        self.rejected_count = 0
+
+        self._retry_at = 0.0
+        self._trial_started = 0.0
+
+    def before_request(self) -> None:
+        """Raise if the request should not be sent."""
+        if self.state == CircuitState.CLOSED:
+            return
+
+        # Once the delay has passed, a single trial request is let through
+        now = time.monotonic()
+        if self.state == CircuitState.OPEN and now >= self._retry_at:
+            LOGGER.debug("Circuit for %s half-open, sending trial request", self.name)
+            self.state = CircuitState.HALF_OPEN
+            self._trial_started = now
+            return
+
+        if (
+            self.state == CircuitState.HALF_OPEN
+            and now - self._trial_started > TRIAL_TIMEOUT
+        ):
+            self._trial_started = now
+            return
+
+        self.rejected_count += 1
+        raise MagicMirrorCircuitOpenError(self.name, self.retry_in)
+
+    def record_success(self) -> None:
+        """Record a request that reached the mirror."""
+        if self.state != CircuitState.CLOSED:
+            LOGGER.info("%s is reachable again", self.name)
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.delay = BASE_DELAY
+
+    def record_failure(self) -> None:
+        """Record a request that could not reach the mirror."""
+        # A failed trial opens the circuit again for twice the delay
+        if self.state == CircuitState.HALF_OPEN:
+            self.delay = min(self.delay * 2, MAX_DELAY)
+            self._open()
+            return
+
+        self.failures += 1
+        if self.state == CircuitState.CLOSED and self.failures >= FAILURE_THRESHOLD:
+            self._open()
+
+    def _open(self) -> None:
+        """Open the circuit."""
+        LOGGER.warning(
+            "%s is unreachable, pausing requests for %.0f s", self.name, self.delay
+        )
+        self.state = CircuitState.OPEN
+        self.opened_count += 1
+        self._retry_at = time.monotonic() + self.delay
+
+    @property
+    def retry_in(self) -> float:
+        """Return seconds until the next trial request."""
+        return max(0.0, self._retry_at - time.monotonic())
+
+    def as_dict(self) -> dict[str, float | int | str]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "delay": self.delay,
+            "retry_in": self.retry_in,
+            "opened_count": self.opened_count,
+            "rejected_count": self.rejected_count,
+        }
@@ -8,11 +8,22 @@ import aiohttp
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_API_KEY, CONF_HOST, CONF_NAME, CONF_PORT
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from custom_components.magicmirror.api import MagicMirrorApiClient
-from custom_components.magicmirror.const import DOMAIN, LOGGER
+from custom_components.magicmirror.const import (
+    CONF_DEDICATED_SESSION,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    CONF_PUSH,
+    CONF_SOCKET,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DOMAIN,
+    LOGGER,
+)
 from custom_components.magicmirror.models import GenericResponse
 
 SCHEMA = vol.Schema(
@@ -30,6 +41,14 @@ class MagicMirrorFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        _config_entry: config_entries.ConfigEntry,
+    ) -> MagicMirrorOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return MagicMirrorOptionsFlowHandler()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -85,3 +104,41 @@ class MagicMirrorFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             f"{entry.data.get(CONF_HOST)}" for entry in self._async_current_entries()
         ]
         return host in existing_devices
+
+
+class MagicMirrorOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for MagicMirror."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_PUSH, default=options.get(CONF_PUSH, False)
+                    ): bool,
+                    vol.Required(
+                        CONF_SOCKET, default=options.get(CONF_SOCKET, False)
+                    ): bool,
+                    vol.Required(
+                        CONF_DEDICATED_SESSION,
+                        default=options.get(CONF_DEDICATED_SESSION, False),
+                    ): bool,
+                    vol.Required(
+                        CONF_MIN_INTERVAL,
+                        default=options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5)),
+                    vol.Required(
+                        CONF_MAX_INTERVAL,
+                        default=options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5)),
+                }
+            ),
+        )
@@ -1,5 +1,6 @@
 """Constants for MagicMirror."""
 
+from datetime import timedelta
 from logging import Logger, getLogger
 
 from homeassistant.const import Platform
@@ -10,8 +11,29 @@ DOMAIN = "magicmirror"
 PLATFORMS = [
     Platform.BUTTON,
     Platform.LIGHT,
+    Platform.SENSOR,
     Platform.SWITCH,
     Platform.UPDATE,
 ]
 DATA_HASS_CONFIG = "mm_hass_config"
 ATTR_CONFIG_ENTRY_ID = "entry_id"
+DATA_SCHEDULER = "fleet_scheduler"
+ATTR_BROADCAST = "broadcast"
+EVENT_BROADCAST = f"{DOMAIN}_broadcast"
+
+CONF_PUSH = "push"
+CONF_SOCKET = "socket"
+CONF_DEDICATED_SESSION = "dedicated_session"
+CONF_MIN_INTERVAL = "min_interval"
+CONF_MAX_INTERVAL = "max_interval"
+
+SCAN_INTERVAL = timedelta(minutes=1)
+UPDATE_SCAN_INTERVAL = timedelta(minutes=30)
+PUSH_SCAN_INTERVAL = timedelta(minutes=15)
+
+DEFAULT_MIN_INTERVAL = 10
+DEFAULT_MAX_INTERVAL = 300
+ACTIVITY_WINDOW = timedelta(minutes=2)
+IDLE_AFTER = timedelta(minutes=10)
+
+MAX_CONCURRENT_POLLS = 4
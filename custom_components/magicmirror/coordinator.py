@@ -2,40 +2,96 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import time
+from collections import deque
 from datetime import timedelta
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from aiohttp.client_exceptions import ClientConnectorError
-from async_timeout import timeout
-from homeassistant.core import HomeAssistant
+import attr
+from homeassistant.const import STATE_OFF
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
-from voluptuous.error import Error
 
-from custom_components.magicmirror.api import MagicMirrorApiClient
-from custom_components.magicmirror.const import DOMAIN, LOGGER
+from custom_components.magicmirror.circuit_breaker import MagicMirrorCircuitOpenError
+from custom_components.magicmirror.const import (
+    ACTIVITY_WINDOW,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DOMAIN,
+    IDLE_AFTER,
+    LOGGER,
+    SCAN_INTERVAL,
+    UPDATE_SCAN_INTERVAL,
+)
+from custom_components.magicmirror.metrics import (
+    POLL_TRACE_SIZE,
+    PollTrace,
+    RequestMetrics,
+)
 from custom_components.magicmirror.models import (
+    Entity,
     MagicMirrorData,
+    MagicMirrorUpdateData,
+    ModuleDataResponse,
     ModuleResponse,
+    ModuleUpdateResponse,
     ModuleUpdateResponses,
     MonitorResponse,
     QueryResponse,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable, Mapping
 
-class MagicMirrorDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching MagicMirror data."""
+    from custom_components.magicmirror.api import MagicMirrorApiClient
+    from custom_components.magicmirror.notification_queue import (
+        MagicMirrorNotificationQueue,
+    )
+    from custom_components.magicmirror.scheduler import MagicMirrorFleetScheduler
+
+PARTIAL_REFRESH_COOLDOWN = 1.0
+
+_DataT = TypeVar("_DataT")
 
-    data: MagicMirrorData
+
+class MagicMirrorCoordinator(DataUpdateCoordinator[_DataT]):
+    """Base class for coordinators polling a MagicMirror."""
+
+    fetchers: dict[Entity, Callable[[], Awaitable[Any]]]
+
+    # Whether scheduled polls wait for a free fleet poll slot
+    queue_polls = False
 
     def __init__(
-        self, hass: HomeAssistant, api: MagicMirrorApiClient, name: str
+        self,
+        hass: HomeAssistant,
+        api: MagicMirrorApiClient,
+        name: str,
+        update_interval: timedelta,
+        scheduler: MagicMirrorFleetScheduler | None = None,
     ) -> None:
         """Initialize."""
         self.api = api
-        self.name = name
+        self.mirror_name = name
+        self.stale = False
+        self._verify_pending = False
+        self.suppressed_writes = 0
+        # With a fleet scheduler, update_interval holds the delay until the
+        # next slot, while poll_interval holds the interval asked for
+        self.poll_interval = update_interval
+        self.poll_metrics = RequestMetrics()
+        self.poll_traces: deque[PollTrace] = deque(maxlen=POLL_TRACE_SIZE)
+        self.scheduler = scheduler
+        self._slot = scheduler.register(self) if scheduler else 0.0
 
         self._attr_device_info = DeviceInfo(
             name=name,
@@ -45,44 +101,343 @@ class MagicMirrorDataUpdateCoordinator(DataUpdateCoordinator):
             configuration_url=f"{api.base_url}/remote.html",
         )
 
+        # The API client hands back the same model objects for unchanged
+        # payloads, so comparing the polled data is cheap
         super().__init__(
             hass,
             LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(minutes=1),
+            update_interval=update_interval,
+            always_update=False,
         )
 
-    async def _async_update_data(self) -> MagicMirrorData:
-        """Update data via library."""
+        self._pending_keys: set[Entity] = set()
+        self._partial_refresh_debouncer = Debouncer(
+            hass,
+            LOGGER,
+            cooldown=PARTIAL_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self._async_partial_refresh,
+        )
+
+    async def async_request_partial_refresh(self, keys: Iterable[Entity]) -> None:
+        """Request a refresh of some endpoints, merged within the cooldown."""
+        self._pending_keys.update(keys)
+        await self._partial_refresh_debouncer.async_call()
+
+    async def _async_partial_refresh(self) -> None:
+        """Refresh the pending endpoints and merge them into the data."""
+        keys = [key for key in self.fetchers if key in self._pending_keys]
+        self._pending_keys.clear()
+
+        if self.data is None:
+            await self.async_refresh()
+            return
+
         try:
-            async with timeout(20):
-                update: QueryResponse = await self.api.mm_update_available()
-                module_updates: ModuleUpdateResponses = (
-                    await self.api.update_available()
+            fields = await self.async_fetch_fields(keys)
+        except UpdateFailed as error:
+            LOGGER.warning("Partial refresh failed: %s", error)
+            return
+
+        data = attr.evolve(self.data, **fields)
+        if self.always_update or data != self.data:
+            self.data = data
+            self.async_update_listeners()
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled call, and ignore new runs."""
+        await super().async_shutdown()
+        self._partial_refresh_debouncer.async_shutdown()
+        if self.scheduler is not None:
+            self.scheduler.unregister(self)
+
+    def _schedule_next_poll(self, interval: timedelta) -> None:
+        """Set the polling interval, timing the next poll to the slot."""
+        if interval != self.poll_interval:
+            LOGGER.debug("Polling %s every %s", self.mirror_name, interval)
+        self.poll_interval = interval
+        if self.scheduler is not None:
+            interval = self.scheduler.next_delay(self._slot, interval)
+        self.update_interval = interval
+
+    @callback
+    def async_restore(self, data: _DataT) -> None:
+        """Start from restored data, marked stale until the next poll."""
+        self.data = data
+        self.stale = True
+        # Notify after that poll even if unchanged, so entities drop the mark
+        self.always_update = True
+
+    @callback
+    def async_verify_on_next_poll(self) -> None:
+        """Notify listeners after the next poll, even if the data is unchanged."""
+        # Optimistic entities rely on that poll when a command had no effect
+        self._verify_pending = True
+        self.always_update = True
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners."""
+        self.always_update = self.stale or self._verify_pending
+        super().async_update_listeners()
+
+    async def _async_poll(self) -> dict[str, Any]:
+        """Fetch every endpoint for a scheduled poll."""
+        # The first poll never waits, so a slow mirror cannot hold up setup
+        queued = self.queue_polls and self.data is not None and not self.stale
+        try:
+            fields = await self.async_fetch_fields(list(self.fetchers), queued=queued)
+        except Exception:
+            # Keep timing the next poll to the slot
+            self._schedule_next_poll(self.poll_interval)
+            raise
+
+        self.stale = False
+        self._verify_pending = False
+        return fields
+
+    async def _async_fetch(self, key: Entity) -> Any:
+        """Fetch a single endpoint, isolating its failure from the others."""
+        try:
+            return await self.fetchers[key]()
+        except MagicMirrorCircuitOpenError as error:
+            LOGGER.debug("Skipped fetching %s: %s", key.value, error)
+            return error
+        except Exception as error:  # noqa: BLE001
+            LOGGER.warning("Failed to fetch %s for MagicMirror: %s", key.value, error)
+            return error
+
+    async def async_fetch_fields(
+        self, keys: list[Entity], *, queued: bool = False
+    ) -> dict[str, Any]:
+        """Fetch the given endpoints concurrently, keeping failed ones as they were."""
+        poll = (
+            self.scheduler.async_poll()
+            if queued and self.scheduler is not None
+            else contextlib.nullcontext()
+        )
+        phases: dict[str, float] = {}
+        started_at = time.time()
+        mark = time.monotonic()
+        success = False
+        try:
+            async with poll:
+                mark = _end_phase(phases, "queue", mark)
+                results = await asyncio.gather(
+                    *(self._async_fetch(key) for key in keys)
                 )
-                monitor: MonitorResponse = await self.api.monitor_status()
-                brightness: QueryResponse = await self.api.get_brightness()
-                modules: ModuleResponse = await self.api.get_modules()
-
-                if not monitor.success:
-                    LOGGER.warning("Failed to fetch monitor-status for MagicMirror")
-                if not update.success:
-                    LOGGER.warning("Failed to fetch update-status for MagicMirror")
-                if not brightness.success:
-                    LOGGER.warning("Failed to fetch brightness for MagicMirror")
-                if not modules.success:
-                    LOGGER.warning("Failed to fetch modules for MagicMirror")
-                if not module_updates.success:
-                    LOGGER.warning("Failed to fetch module updates for MagicMirror")
-
-                return MagicMirrorData(
-                    monitor_status=monitor.monitor,
-                    update_available=update.result,
-                    module_updates=module_updates.result,
-                    brightness=int(brightness.result),
-                    modules=modules.data,
+                mark = _end_phase(phases, "fetch", mark)
+
+                if all(isinstance(result, Exception) for result in results):
+                    self.poll_metrics.record_error(phases["fetch"])
+                    exception = f"Unable to reach MagicMirror: {results[0]}"
+                    raise UpdateFailed(exception)
+
+                self.poll_metrics.record(phases["fetch"])
+
+            fields: dict[str, Any] = {}
+            for key, result in zip(keys, results, strict=True):
+                if not isinstance(result, Exception):
+                    fields[key.value] = result
+                elif self.data is not None:
+                    fields[key.value] = getattr(self.data, key.value)
+                else:
+                    exception = f"Failed to fetch {key.value}: {result}"
+                    raise UpdateFailed(exception)
+
+            _end_phase(phases, "merge", mark)
+            success = True
+            return fields
+        finally:
+            self.poll_traces.append(
+                PollTrace(
+                    start=started_at,
+                    keys=tuple(key.value for key in keys),
+                    phases=phases,
+                    success=success,
                 )
+            )
+
+
+def _end_phase(phases: dict[str, float], phase: str, start: float) -> float:
+    """Record the duration of a poll phase, returning when it ended."""
+    end = time.monotonic()
+    phases[phase] = end - start
+    return end
+
+
+class MagicMirrorDataUpdateCoordinator(MagicMirrorCoordinator[MagicMirrorData]):
+    """Class to manage fetching fast-changing MagicMirror state."""
+
+    data: MagicMirrorData
+
+    queue_polls = True
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: MagicMirrorApiClient,
+        name: str,
+        options: Mapping[str, Any] | None = None,
+        scheduler: MagicMirrorFleetScheduler | None = None,
+    ) -> None:
+        """Initialize."""
+        options = options or {}
+        min_interval = options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL)
+        max_interval = options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL)
+        self.fetchers = {
+            Entity.MONITOR_STATUS: self._async_fetch_monitor_status,
+            Entity.BRIGHTNESS: self._async_fetch_brightness,
+            Entity.MODULES: self._async_fetch_modules,
+        }
+        self.base_interval = SCAN_INTERVAL
+        self.min_interval = timedelta(seconds=min_interval)
+        self.max_interval = timedelta(seconds=max(min_interval, max_interval))
+        self._active_until = 0.0
+        self._last_change = time.monotonic()
+
+        super().__init__(hass, api, name, SCAN_INTERVAL, scheduler)
+
+    @callback
+    def async_note_activity(self) -> None:
+        """Poll fast for a short window, e.g. after a user command."""
+        self._active_until = time.monotonic() + ACTIVITY_WINDOW.total_seconds()
+        if self.poll_interval != self.min_interval:
+            self.poll_interval = self.min_interval
+            self.update_interval = self.min_interval
+            if self._listeners:
+                self._schedule_refresh()
+
+    def _adapt_interval(self, data: MagicMirrorData) -> None:
+        """Pick the interval until the next poll."""
+        # Poll fast for a short window after commands or detected changes, and
+        # back off while the monitor is off and nothing has changed for a while
+        now = time.monotonic()
+        if self.data is not None and data != self.data:
+            self._last_change = now
+            self._active_until = now + ACTIVITY_WINDOW.total_seconds()
+
+        if now < self._active_until:
+            interval = self.min_interval
+        elif (
+            data.monitor_status == STATE_OFF
+            and now - self._last_change > IDLE_AFTER.total_seconds()
+        ):
+            interval = max(self.max_interval, self.base_interval)
+        else:
+            interval = max(self.min_interval, self.base_interval)
+            if self.base_interval <= self.max_interval:
+                interval = min(interval, self.max_interval)
+
+        self._schedule_next_poll(interval)
+
+    async def _async_fetch_monitor_status(self) -> str:
+        """Fetch monitor status."""
+        monitor: MonitorResponse = await self.api.monitor_status()
+        if not monitor.success:
+            exception = "Failed to fetch monitor-status for MagicMirror"
+            raise UpdateFailed(exception)
+        return monitor.monitor
+
+    async def _async_fetch_brightness(self) -> int:
+        """Fetch brightness."""
+        brightness: QueryResponse = await self.api.get_brightness()
+        if not brightness.success:
+            exception = "Failed to fetch brightness for MagicMirror"
+            raise UpdateFailed(exception)
+        if brightness.result is None:
+            exception = "MagicMirror did not report its brightness"
+            raise UpdateFailed(exception)
+        return int(brightness.result)
+
+    async def _async_fetch_modules(self) -> list[ModuleDataResponse]:
+        """Fetch modules."""
+        modules: ModuleResponse = await self.api.get_modules()
+        if not modules.success:
+            exception = "Failed to fetch modules for MagicMirror"
+            raise UpdateFailed(exception)
+        return modules.data
+
+    async def _async_update_data(self) -> MagicMirrorData:
+        """Update data via library."""
+        data = MagicMirrorData(**await self._async_poll())
+        self._adapt_interval(data)
+        return data
+
+    @callback
+    def async_apply_delta(self, delta: dict[str, Any]) -> None:
+        """Apply a state delta pushed by the mirror."""
+        if self.data is None:
+            return
+
+        fields: dict[str, Any] = {}
+        if Entity.MONITOR_STATUS.value in delta:
+            fields[Entity.MONITOR_STATUS.value] = delta[Entity.MONITOR_STATUS.value]
+        if Entity.BRIGHTNESS.value in delta:
+            fields[Entity.BRIGHTNESS.value] = delta[Entity.BRIGHTNESS.value]
+        if modules := delta.get(Entity.MODULES.value):
+            fields[Entity.MODULES.value] = [
+                attr.evolve(module, **modules[module.identifier])
+                if module.identifier in modules
+                else module
+                for module in self.data.modules
+            ]
+
+        data = attr.evolve(self.data, **fields)
+        if data != self.data:
+            self.data = data
+            self.async_update_listeners()
+
+
+class MagicMirrorUpdateCoordinator(MagicMirrorCoordinator[MagicMirrorUpdateData]):
+    """Class to manage fetching MagicMirror update availability."""
+
+    data: MagicMirrorUpdateData
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: MagicMirrorApiClient,
+        name: str,
+        scheduler: MagicMirrorFleetScheduler | None = None,
+    ) -> None:
+        """Initialize."""
+        self.fetchers = {
+            Entity.UPDATE_AVAILABLE: self._async_fetch_update_available,
+            Entity.MODULE_UPDATES: self._async_fetch_module_updates,
+        }
+        # The update checks make the mirror run git for every installed module
+        super().__init__(hass, api, name, UPDATE_SCAN_INTERVAL, scheduler)
+
+    async def _async_fetch_update_available(self) -> bool:
+        """Fetch MagicMirror update status."""
+        update: QueryResponse = await self.api.mm_update_available()
+        if not update.success:
+            exception = "Failed to fetch update-status for MagicMirror"
+            raise UpdateFailed(exception)
+        return update.result
+
+    async def _async_fetch_module_updates(self) -> list[ModuleUpdateResponse]:
+        """Fetch module update status."""
+        module_updates: ModuleUpdateResponses = await self.api.update_available()
+        if not module_updates.success:
+            exception = "Failed to fetch module updates for MagicMirror"
+            raise UpdateFailed(exception)
+        return module_updates.result
+
+    async def _async_update_data(self) -> MagicMirrorUpdateData:
+        """Update data via library."""
+        data = MagicMirrorUpdateData(**await self._async_poll())
+        self._schedule_next_poll(UPDATE_SCAN_INTERVAL)
+        return data
+
+
+@attr.s(auto_attribs=True)
+class MagicMirrorRuntimeData:
+    """Class representing the runtime data of a config entry."""
 
-        except (Error, ClientConnectorError) as error:
-            LOGGER.error("Update error %s", error)
-            raise UpdateFailed(error) from error
+    coordinator: MagicMirrorDataUpdateCoordinator
+    update_coordinator: MagicMirrorUpdateCoordinator
+    notifications: MagicMirrorNotificationQueue
+    profile: dict[str, Any] | None = None
@@ -2,45 +2,34 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
+import attr
+from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_API_KEY, CONF_WEBHOOK_ID
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntry
 
-from custom_components.magicmirror.api import MagicMirrorApiClient
 from custom_components.magicmirror.const import DOMAIN, LOGGER
-from custom_components.magicmirror.coordinator import MagicMirrorDataUpdateCoordinator
+
+if TYPE_CHECKING:
+    from custom_components.magicmirror.api import MagicMirrorApiClient
+    from custom_components.magicmirror.coordinator import MagicMirrorRuntimeData
+
+TO_REDACT = {CONF_API_KEY, CONF_WEBHOOK_ID}
+
+# Caps keeping the download small on mirrors with many modules
+MAX_MODULES = 50
+MAX_MODULE_UPDATES = 50
 
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    LOGGER.debug("diagnostics entry %s", entry.as_dict())
-
-    coordinator: MagicMirrorDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    api: MagicMirrorApiClient = coordinator.api
-    data = coordinator.data
-    LOGGER.debug("diagnostics data %s", data)
-
-    return {
-        "host": api.host,
-        "port": api.port,
-        "brightness": data.brightness,
-        "monitor_status": data.monitor_status,
-        "update_available": data.update_available,
-        "module_updates": data.module_updates,
-        "modules": str(data.modules),
-    }
-
-    # todo
-    # TO_REDACT = [
-    #    CONF_API_KEY,
-    #    APPLIANCE_CODE
-    # ]
-    # return {
-    #    "entry_data": async_redact_data(entry.data, TO_REDACT),
-    #    "data": entry.runtime_data.data,
-    # }
+    runtime_data: MagicMirrorRuntimeData = hass.data[DOMAIN][entry.entry_id]
+    return _diagnostics(entry, runtime_data)
 
 
 async def async_get_device_diagnostics(
@@ -48,16 +37,80 @@ async def async_get_device_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a device."""
     LOGGER.debug("diagnostics device %s", device)
-    LOGGER.debug("diagnostics entry %s", entry.as_dict())
-    coordinator: MagicMirrorDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    runtime_data: MagicMirrorRuntimeData = hass.data[DOMAIN][entry.entry_id]
+    return _diagnostics(entry, runtime_data)
+
+
+def _diagnostics(
+    entry: ConfigEntry, runtime_data: MagicMirrorRuntimeData
+) -> dict[str, Any]:
+    """Return diagnostics for a mirror, with the API key and webhook redacted."""
+    coordinator = runtime_data.coordinator
+    update_coordinator = runtime_data.update_coordinator
     api: MagicMirrorApiClient = coordinator.api
     data = coordinator.data
-    return {
-        "host": api.host,
-        "port": api.port,
-        "brightness": data.brightness,
-        "monitor_status": data.monitor_status,
-        "update_available": data.update_available,
-        "module_updates": data.module_updates,
-        "modules": str(data.modules),
-    }
+    update_data = update_coordinator.data
+    module_updates = update_data.module_updates if update_data else []
+
+    return async_redact_data(
+        {
+            "entry": entry.as_dict(),
+            "host": api.host,
+            "port": api.port,
+            "brightness": data.brightness,
+            "monitor_status": data.monitor_status,
+            "update_available": update_data.update_available if update_data else None,
+            "module_updates": [
+                attr.asdict(update) for update in module_updates[:MAX_MODULE_UPDATES]
+            ],
+            "modules": [
+                {
+                    "identifier": module.identifier,
+                    "name": module.name,
+                    "header": module.header,
+                    "hidden": module.hidden,
+                }
+                for module in data.modules[:MAX_MODULES]
+            ],
+            "module_count": len(data.modules),
+            "payload_cache": attr.asdict(api.payload_stats),
+            "decoding": attr.asdict(api.decode_stats),
+            "circuit_breaker": api.breaker.as_dict(),
+            "retries": attr.asdict(api.retry_stats),
+            "connections": (
+                attr.asdict(api.connection_stats) if api.connection_stats else None
+            ),
+            "notifications": runtime_data.notifications.as_dict(),
+            "endpoints": {
+                endpoint: metrics.as_dict()
+                for endpoint, metrics in api.endpoint_metrics.items()
+            },
+            "polls": {
+                "state": coordinator.poll_metrics.as_dict(),
+                "updates": update_coordinator.poll_metrics.as_dict(),
+            },
+            "command_latency": {
+                transport: attr.asdict(latency)
+                for transport, latency in api.command_latency.items()
+            },
+            "update_interval": coordinator.poll_interval.total_seconds(),
+            "fleet": (
+                coordinator.scheduler.as_dict() if coordinator.scheduler else None
+            ),
+            "suppressed_writes": {
+                "state": coordinator.suppressed_writes,
+                "updates": update_coordinator.suppressed_writes,
+            },
+            "traces": {
+                "requests": [attr.asdict(trace) for trace in api.traces],
+                "polls": {
+                    "state": [attr.asdict(trace) for trace in coordinator.poll_traces],
+                    "updates": [
+                        attr.asdict(trace) for trace in update_coordinator.poll_traces
+                    ],
+                },
+            },
+            "profile": runtime_data.profile,
+        },
+        TO_REDACT,
+    )
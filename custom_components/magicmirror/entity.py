@@ -0,0 +1,93 @@
+"""Base entity for MagicMirror."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from custom_components.magicmirror.const import LOGGER
+from custom_components.magicmirror.coordinator import MagicMirrorCoordinator
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
+    from custom_components.magicmirror.models import Entity
+
+
+class MagicMirrorEntity(CoordinatorEntity[MagicMirrorCoordinator]):
+    """Define a MagicMirror entity, written only when its own slice changed."""
+
+    _written_state: tuple[Any, ...] | None = None
+
+    # Endpoints to refresh when a command leaves the state uncertain.
+    refresh_keys: tuple[Entity, ...] = ()
+
+    @property
+    def assumed_state(self) -> bool:
+        """Return True while the state is restored and not yet polled."""
+        return self.coordinator.stale
+
+    def update_from_data(self) -> None:
+        """Update sensor data."""
+
+    def state_key(self) -> tuple[Any, ...]:
+        """Return the values this entity renders from coordinator data."""
+        return ()
+
+    def restore_state(self, state: tuple[Any, ...]) -> None:
+        """Restore values previously returned by state_key."""
+
+    async def async_command(self, command: Awaitable[bool | None]) -> bool | None:
+        """Write an optimistic state change and confirm it with a command."""
+        # The command returns True when the mirror confirmed the new state,
+        # False when it failed, and None when it did not state the result
+        previous = self._written_state
+        self.async_write_ha_state()
+        self.coordinator.async_note_activity()
+
+        try:
+            confirmed = await command
+        except Exception:
+            self._async_rollback(previous)
+            await self.coordinator.async_request_partial_refresh(self.refresh_keys)
+            raise
+
+        if confirmed is False:
+            LOGGER.warning("MagicMirror did not confirm %s", self.entity_id)
+            self._async_rollback(previous)
+            await self.coordinator.async_request_partial_refresh(self.refresh_keys)
+            return False
+
+        self.coordinator.async_verify_on_next_poll()
+        return confirmed
+
+    @callback
+    def _async_rollback(self, previous: tuple[Any, ...] | None) -> None:
+        """Roll back to a previously written state."""
+        if previous is None:
+            return
+        self.restore_state(previous[2:])
+        self.async_write_ha_state()
+
+    def _rendered_state(self) -> tuple[Any, ...]:
+        """Return everything the written state depends on."""
+        return (self.available, self.assumed_state, *self.state_key())
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and remember what was written."""
+        self._written_state = self._rendered_state()
+        super().async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle data update."""
+        # Skip the write when the values rendered from this entity's own slice
+        # of coordinator data are what was last written
+        self.update_from_data()
+        if self._rendered_state() == self._written_state:
+            self.coordinator.suppressed_writes += 1
+            return
+        self.async_write_ha_state()
@@ -1,23 +1,34 @@
 """Light entity for MagicMirror."""
 
+import asyncio
+import time
+from collections.abc import Coroutine
 from math import ceil
 from typing import Any
 
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
+    ATTR_TRANSITION,
     ColorMode,
     LightEntity,
     LightEntityDescription,
+    LightEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import STATE_ON
+from homeassistant.const import STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from custom_components.magicmirror.const import DOMAIN
-from custom_components.magicmirror.coordinator import MagicMirrorDataUpdateCoordinator
-from custom_components.magicmirror.models import Entity
+from custom_components.magicmirror.const import DOMAIN, LOGGER
+from custom_components.magicmirror.coordinator import (
+    MagicMirrorDataUpdateCoordinator,
+    MagicMirrorRuntimeData,
+)
+from custom_components.magicmirror.entity import MagicMirrorEntity
+from custom_components.magicmirror.models import Entity, MonitorResponse
+
+TRANSITION_MIN_STEP = 0.1
+TRANSITION_RTT_SMOOTHING = 0.3
 
 
 async def async_setup_entry(
@@ -26,7 +37,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Add MagicMirror entities from a config_entry."""
-    coordinator: MagicMirrorDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    runtime_data: MagicMirrorRuntimeData = hass.data[DOMAIN][entry.entry_id]
+    coordinator = runtime_data.coordinator
 
     async_add_entities(
         [
@@ -41,13 +53,19 @@ async def async_setup_entry(
     )
 
 
-class MagicMirrorLight(CoordinatorEntity, LightEntity):
+class MagicMirrorLight(MagicMirrorEntity, LightEntity):
     """Define a MagicMirror."""
 
     monitor_state: bool
     brightness_state: int
     coordinator: MagicMirrorDataUpdateCoordinator
 
+    refresh_keys = (Entity.MONITOR_STATUS, Entity.BRIGHTNESS)
+
+    _attr_supported_features = LightEntityFeature.TRANSITION
+    _transition_task: asyncio.Task | None = None
+    _brightness_rtt: float = TRANSITION_MIN_STEP
+
     def __init__(
         self,
         coordinator: MagicMirrorDataUpdateCoordinator,
@@ -89,30 +107,153 @@ class MagicMirrorLight(CoordinatorEntity, LightEntity):
             coordinator_data.__getattribute__(Entity.BRIGHTNESS.value)
         )
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle data update."""
-        self.update_from_data()
-        super()._handle_coordinator_update()
+    def state_key(self) -> tuple[Any, ...]:
+        """Return the values this entity renders from coordinator data."""
+        return (self.monitor_state, self.brightness_state)
+
+    def restore_state(self, state: tuple[Any, ...]) -> None:
+        """Restore values previously returned by state_key."""
+        self.monitor_state, self.brightness_state = state
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
+        await self._async_stop_transition()
+
+        brightness = None
         if ATTR_BRIGHTNESS in kwargs:
-            await self.coordinator.api.brightness(
-                ceil(kwargs[ATTR_BRIGHTNESS] * 100 / 255.0)
+            brightness = ceil(kwargs[ATTR_BRIGHTNESS] * 100 / 255.0)
+
+        monitor_on = not self.monitor_state
+
+        if transition := kwargs.get(ATTR_TRANSITION):
+            target = self.brightness_state if brightness is None else brightness
+            start = 0 if monitor_on else self.brightness_state
+
+            self.monitor_state = True
+            self.brightness_state = target
+            confirmed = await self.async_command(
+                self._async_send_on(
+                    start if monitor_on else None, monitor_on=monitor_on
+                )
             )
+            if confirmed is not False:
+                self._async_start_transition(
+                    self._async_ramp(start, target, transition)
+                )
+            return
+
+        if brightness is not None:
+            self.brightness_state = brightness
 
-        await self.coordinator.api.monitor_on()
         self.monitor_state = True
-        await self.coordinator.async_request_refresh()
+        await self.async_command(self._async_send_on(brightness, monitor_on=monitor_on))
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
-        await self.coordinator.api.monitor_off()
+        await self._async_stop_transition()
+
+        if transition := kwargs.get(ATTR_TRANSITION):
+            self._async_start_transition(
+                self._async_fade_out(self.brightness_state, transition)
+            )
+            return
+
         self.monitor_state = False
-        await self.coordinator.async_request_refresh()
+        await self.async_command(self._async_send_off())
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel any running transition."""
+        await self._async_stop_transition()
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _async_start_transition(self, ramp: Coroutine[Any, Any, Any]) -> None:
+        """Run a brightness ramp in the background."""
+        self._transition_task = self.hass.async_create_background_task(
+            ramp, f"{DOMAIN} brightness transition"
+        )
+
+    async def _async_stop_transition(self) -> None:
+        """Cancel the running brightness ramp, if any, and wait for it to end."""
+        task, self._transition_task = self._transition_task, None
+        if task is None or task.done():
+            return
+        # Waiting lets a cancelled fade restore the brightness before the next
+        # command is sent
+        task.cancel()
+        await asyncio.wait([task])
+
+    async def _async_ramp(self, start: int, target: int, duration: float) -> bool:
+        """Ramp brightness over duration seconds, returning if it reached target."""
+        api = self.coordinator.api
+        ramp_start = time.monotonic()
+        sent = start
+
+        while (elapsed := time.monotonic() - ramp_start) < duration:
+            value = round(start + (target - start) * elapsed / duration)
+            rtt = 0.0
+
+            if value != sent:
+                request_start = time.monotonic()
+                response = await api.set_brightness(value)
+                rtt = time.monotonic() - request_start
+                if not response.success:
+                    LOGGER.warning("Brightness transition stopped at %s", sent)
+                    return False
+                sent = value
+                self._brightness_rtt += TRANSITION_RTT_SMOOTHING * (
+                    rtt - self._brightness_rtt
+                )
+
+            # Steps follow the measured round-trip time, so the ramp never
+            # queues more requests than the mirror can serve
+            step = max(TRANSITION_MIN_STEP, self._brightness_rtt)
+            await asyncio.sleep(max(0.0, step - rtt))
+
+        if sent != target:
+            return (await api.set_brightness(target)).success
+        return True
+
+    async def _async_fade_out(self, brightness: int, duration: float) -> None:
+        """Fade the monitor out, turn it off and restore its brightness."""
+        try:
+            if not await self._async_ramp(brightness, 0, duration):
+                return
+            # Only shown as off once the fade went through
+            self.monitor_state = False
+            await self.async_command(self._async_send_off())
+        finally:
+            # Also when the fade failed or was cancelled
+            await self.coordinator.api.set_brightness(brightness)
+
+    async def _async_send_on(
+        self, brightness: int | None, *, monitor_on: bool
+    ) -> bool | None:
+        """Send brightness and monitor on, returning whether the mirror confirmed."""
+        if brightness is not None:
+            response = await self.coordinator.api.set_brightness(brightness)
+            if not response.success:
+                return False
+
+        if not monitor_on:
+            return True
+
+        return _monitor_confirmed(await self.coordinator.api.monitor_on(), STATE_ON)
+
+    async def _async_send_off(self) -> bool | None:
+        """Send monitor off, returning whether the mirror confirmed it."""
+        return _monitor_confirmed(await self.coordinator.api.monitor_off(), STATE_OFF)
 
     @property
     def brightness(self) -> int | None:
         """Return the brightness of the light."""
         return ceil(self.brightness_state * 255 / 100)
+
+
+def _monitor_confirmed(monitor: MonitorResponse, state: str) -> bool | None:
+    """Return whether a reply confirmed the monitor state, None if it omitted it."""
+    if not monitor.success:
+        return False
+    if monitor.monitor is None:
+        return None
+    return monitor.monitor == state
@@ -0,0 +1,111 @@
+"""Request metrics for MagicMirror."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+import attr
+
+# Upper bounds of the latency histogram buckets in seconds
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, float("inf"))
+
+# Number of recent latencies percentiles are computed from
+LATENCY_SAMPLES = 200
+
+# Number of recent requests and polls kept for diagnostics
+REQUEST_TRACE_SIZE = 100
+POLL_TRACE_SIZE = 50
+
+
+@attr.s(auto_attribs=True)
+class RequestMetrics:
+    """Class representing latency, error and size metrics of requests."""
+
+    requests: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    bytes_total: int = 0
+    last_size: int | None = None
+    max_size: int = 0
+    last_latency: float | None = None
+    histogram: list[int] = attr.ib(factory=lambda: [0] * len(LATENCY_BUCKETS))
+
+    _samples: deque[float] = attr.ib(
+        factory=lambda: deque(maxlen=LATENCY_SAMPLES), repr=False
+    )
+
+    def record(self, latency: float, size: int | None = None) -> None:
+        """Record a successful request."""
+        self._record_latency(latency)
+        if size is not None:
+            self.bytes_total += size
+            self.last_size = size
+            self.max_size = max(self.max_size, size)
+
+    def record_error(self, latency: float, *, timeout: bool = False) -> None:
+        """Record a failed request."""
+        self._record_latency(latency)
+        if timeout:
+            self.timeouts += 1
+        else:
+            self.errors += 1
+
+    def _record_latency(self, latency: float) -> None:
+        """Record the latency of a request."""
+        self.requests += 1
+        self.last_latency = latency
+        self._samples.append(latency)
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                self.histogram[index] += 1
+                break
+
+    def percentile(self, percent: float) -> float | None:
+        """Return a latency percentile over the recent requests."""
+        if not self._samples:
+            return None
+        samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(len(samples) * percent / 100))]
+
+    @property
+    def availability(self) -> float | None:
+        """Return the percentage of requests that succeeded."""
+        if not self.requests:
+            return None
+        return 100 * (self.requests - self.errors - self.timeouts) / self.requests
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics for diagnostics."""
+        return {
+            **attr.asdict(self, filter=lambda field, _: field.name != "_samples"),
+            "histogram": dict(
+                zip(map(str, LATENCY_BUCKETS), self.histogram, strict=True)
+            ),
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "availability": self.availability,
+        }
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
+class RequestTrace:
+    """Class representing a finished request."""
+
+    endpoint: str
+    method: str
+    start: float
+    duration: float
+    status: int | None
+    size: int | None
+    error: str | None = None
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
+class PollTrace:
+    """Class representing a finished coordinator poll and its phases."""
+
+    start: float
+    keys: tuple[str, ...]
+    phases: dict[str, float]
+    success: bool
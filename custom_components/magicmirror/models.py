@@ -1,7 +1,10 @@
 """Models for MagicMirror."""
 
+import json
+import sys
+from collections.abc import Callable
 from enum import Enum
-from typing import Any
+from typing import Any, Generic, TypeVar
 
 import attr
 
@@ -13,9 +16,15 @@ class Entity(Enum):
 
     MONITOR_STATUS = "monitor_status"
     UPDATE_AVAILABLE = "update_available"
+    MODULE_UPDATES = "module_updates"
     BRIGHTNESS = "brightness"
     MODULES = "modules"
 
+    POLL_LATENCY_P50 = "poll_latency_p50"
+    POLL_LATENCY_P95 = "poll_latency_p95"
+    LAST_POLL_DURATION = "last_poll_duration"
+    AVAILABILITY = "availability"
+
     REBOOT = "reboot"
     RESTART = "restart"
     REFRESH = "refresh"
@@ -34,6 +43,7 @@ class Services(Enum):
     MODULE_AVAILABLE = "module_available"
     MODULE_UPDATE = "module_update"
     MODULE_INSTALL = "module_install"
+    PROFILE = "profile"
 
 
 class ActionsDict:
@@ -43,7 +53,78 @@ class ActionsDict:
     guessed: bool
 
 
-@attr.s(auto_attribs=True)
+def _intern(value: Any) -> Any:
+    """Intern strings repeated across modules and mirrors."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _compact(value: Any) -> str | None:
+    """Encode a rarely read blob as compact JSON."""
+    return None if value is None else json.dumps(value, separators=(",", ":"))
+
+
+_UNDECODED = object()
+
+_T = TypeVar("_T")
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
+class Field:
+    """Class representing how one model attribute is decoded."""
+
+    key: str
+    convert: Callable[[Any], Any] | None = None
+    default: Any = None
+    factory: Callable[[], Any] | None = None
+
+
+class Schema(Generic[_T]):
+    """Decode API payloads into a model in a single pass."""
+
+    def __init__(self, model: type[_T], **fields: Field) -> None:
+        """Compile the schema."""
+        # Flattened once, so decoding is a loop over tuples
+        self.model = model
+        self._fields = tuple(
+            (name, field.key, field.convert, field.default, field.factory)
+            for name, field in fields.items()
+        )
+
+    def __call__(self, data: Any) -> _T:
+        """Decode a payload."""
+        # Malformed values fall back to the field default instead of failing
+        # the whole response, and a non-object payload decodes as empty
+        if not isinstance(data, dict):
+            data = {}
+
+        values: dict[str, Any] = {}
+        for name, key, convert, default, factory in self._fields:
+            value = data.get(key)
+            if value is not None and convert is not None:
+                try:
+                    value = convert(value)
+                except (TypeError, ValueError, AttributeError) as error:
+                    LOGGER.debug(
+                        "Invalid %s in %s: %s", key, self.model.__name__, error
+                    )
+                    value = None
+            if value is None:
+                value = factory() if factory is not None else default
+            values[name] = value
+
+        return self.model(**values)
+
+
+def _list_of(schema: Schema[_T]) -> Callable[[Any], list[_T]]:
+    """Return a converter decoding a list of objects."""
+
+    def convert(value: Any) -> list[_T]:
+        return [schema(item) for item in value]
+
+    return convert
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class ModuleDataResponse:
     """Class representing Module Data Response."""
 
@@ -54,34 +135,56 @@ class ModuleDataResponse:
     file: str
     configDeepMerge: bool
     header: str  # optional
-    config: str  # dict
     classes: str
     hidden: bool
     lockStrings: str  # List
-    actions: str  # optional # Dict[str, ActionsDict]
+    # Kept as compact JSON, as none of the entities read these blobs
+    config_json: str | None = attr.ib(default=None, repr=False)
+    actions_json: str | None = attr.ib(default=None, repr=False)  # optional
+
+    _config: Any = attr.ib(default=_UNDECODED, init=False, eq=False, repr=False)
+    _actions: Any = attr.ib(default=_UNDECODED, init=False, eq=False, repr=False)
+
+    @property
+    def config(self) -> dict[str, Any] | None:
+        """Return the module config, decoding it on first access."""
+        if self._config is _UNDECODED:
+            object.__setattr__(self, "_config", json.loads(self.config_json or "null"))
+        return self._config
+
+    @property
+    def actions(self) -> dict[str, ActionsDict] | None:
+        """Return the module actions, decoding them on first access."""
+        if self._actions is _UNDECODED:
+            object.__setattr__(
+                self, "_actions", json.loads(self.actions_json or "null")
+            )
+        return self._actions
+
+    def as_dict(self) -> dict[str, Any]:
+        """Transform to a dict of the fields the entities render."""
+        # The config and actions blobs stay undecoded and out of the snapshot,
+        # as module configs often hold API keys
+        return {
+            "index": self.index,
+            "identifier": self.identifier,
+            "name": self.name,
+            "path": self.path,
+            "file": self.file,
+            "configDeepMerge": self.configDeepMerge,
+            "header": self.header,
+            "classes": self.classes,
+            "hidden": self.hidden,
+            "lockStrings": self.lockStrings,
+        }
 
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "ModuleDataResponse":
         """Transform data to dict."""
-        LOGGER.debug("ModuleDataResponse=%s", data)
-
-        return ModuleDataResponse(
-            index=data.get("index"),
-            identifier=data.get("identifier"),
-            name=data.get("name"),
-            path=data.get("path"),
-            file=data.get("file"),
-            configDeepMerge=bool(data.get("configDeepMerge")),
-            classes=data.get("classes"),
-            hidden=bool(data.get("hidden")),
-            header=data.get("header"),
-            config=data.get("config"),
-            lockStrings=data.get("lockStrings"),
-            actions=data.get("actions"),
-        )
+        return _MODULE_DATA(data)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class ModuleUpdateResponse:
     """Class representing ModuleUpdateResponse."""
 
@@ -94,29 +197,76 @@ class ModuleUpdateResponse:
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "ModuleUpdateResponse":
         """Transform data to dict."""
-        LOGGER.debug("ModuleUpdateResponse=%s", data)
-
-        return ModuleUpdateResponse(
-            module=data.get("module"),
-            result=bool(data.get("result", False)),
-            remote=data.get("remote") or "",
-            lsremote=data.get("lsremote") or "",
-            behind=int(data.get("behind", 0)),
-        )
+        return _MODULE_UPDATE(data)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class MagicMirrorData:
     """Class representing MagicMirrorData."""
 
     monitor_status: str
-    update_available: bool
-    module_updates: list[ModuleUpdateResponse]
     brightness: int
     modules: list[ModuleDataResponse]
 
+    modules_by_identifier: dict[str, ModuleDataResponse] = attr.ib(
+        init=False, eq=False, repr=False
+    )
 
-@attr.s(auto_attribs=True)
+    def __attrs_post_init__(self) -> None:
+        """Index modules by identifier."""
+        object.__setattr__(
+            self,
+            "modules_by_identifier",
+            {module.identifier: module for module in self.modules},
+        )
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> "MagicMirrorData":
+        """Transform data to dict."""
+        return _MAGIC_MIRROR_DATA(data)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Transform to dict."""
+        return {
+            "monitor_status": self.monitor_status,
+            "brightness": self.brightness,
+            "modules": [module.as_dict() for module in self.modules],
+        }
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
+class MagicMirrorUpdateData:
+    """Class representing MagicMirrorUpdateData."""
+
+    update_available: bool
+    module_updates: list[ModuleUpdateResponse]
+
+    module_updates_by_name: dict[str, ModuleUpdateResponse] = attr.ib(
+        init=False, eq=False, repr=False
+    )
+
+    def __attrs_post_init__(self) -> None:
+        """Index module updates by module name."""
+        module_updates_by_name: dict[str, ModuleUpdateResponse] = {}
+        for update in self.module_updates:
+            module_updates_by_name.setdefault(update.module, update)
+
+        object.__setattr__(self, "module_updates_by_name", module_updates_by_name)
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> "MagicMirrorUpdateData":
+        """Transform data to dict."""
+        return _MAGIC_MIRROR_UPDATE_DATA(data)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Transform to dict."""
+        return {
+            "update_available": self.update_available,
+            "module_updates": [attr.asdict(update) for update in self.module_updates],
+        }
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class ModuleResponse:
     """Class representing Module Response."""
 
@@ -126,19 +276,10 @@ class ModuleResponse:
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "ModuleResponse":
         """Transform data to dict."""
-        LOGGER.debug("ModuleResponse=%s", data)
+        return _MODULE_RESPONSE(data)
 
-        modules: list[ModuleDataResponse] = []
-        for module in data.get("data"):
-            modules.append(ModuleDataResponse.from_dict(module))
-
-        return ModuleResponse(
-            success=bool(data.get("success")),
-            data=modules,
-        )
 
-
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class MonitorResponse:
     """Class representing MagicMirror."""
 
@@ -148,15 +289,10 @@ class MonitorResponse:
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "MonitorResponse":
         """Transform data to dict."""
-        LOGGER.debug("MonitorResponse=%s", data)
-
-        return MonitorResponse(
-            success=bool(data.get("success")),
-            monitor=data.get("monitor"),
-        )
+        return _MONITOR_RESPONSE(data)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class Query:
     """Class representing Query."""
 
@@ -165,11 +301,10 @@ class Query:
     @staticmethod
     def from_dict(query: dict[str, Any]) -> "Query":
         """Transform data to dict."""
-        LOGGER.debug("Query=%s", query)
-        return Query(data=query.get("data"))
+        return _QUERY(query)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class ModuleUpdateResponses:
     """Class representing Module Response."""
 
@@ -179,19 +314,10 @@ class ModuleUpdateResponses:
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "ModuleUpdateResponses":
         """Transform data to dict."""
-        LOGGER.debug("ModuleUpdateResponses=%s", data)
+        return _MODULE_UPDATE_RESPONSES(data)
 
-        module_update: list[ModuleUpdateResponse] = []
-        for module in data.get("result"):
-            module_update.append(ModuleUpdateResponse.from_dict(module))
 
-        return ModuleUpdateResponses(
-            success=bool(data.get("success")),
-            result=module_update,
-        )
-
-
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class QueryResponse:
     """Class representing MagicMirror."""
 
@@ -202,16 +328,10 @@ class QueryResponse:
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "QueryResponse":
         """Transform data to dict."""
-        LOGGER.debug("QueryResponse=%s", data)
+        return _QUERY_RESPONSE(data)
 
-        return QueryResponse(
-            success=bool(data.get("success")),
-            result=data.get("result"),
-            query=Query.from_dict(data.get("query")),
-        )
 
-
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class GenericResponse:
     """Class representing MagicMirror."""
 
@@ -220,8 +340,66 @@ class GenericResponse:
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "GenericResponse":
         """Transform data to dict."""
-        LOGGER.debug("GenericResponse=%s", data)
-
-        return GenericResponse(
-            success=bool(data.get("success")),
-        )
+        return _GENERIC_RESPONSE(data)
+
+
+_MODULE_DATA: Schema[ModuleDataResponse] = Schema(
+    ModuleDataResponse,
+    index=Field("index", int),
+    identifier=Field("identifier", _intern),
+    name=Field("name", _intern),
+    path=Field("path", _intern),
+    file=Field("file", _intern),
+    configDeepMerge=Field("configDeepMerge", bool, default=False),
+    header=Field("header", _intern),
+    classes=Field("classes", _intern),
+    hidden=Field("hidden", bool, default=False),
+    lockStrings=Field("lockStrings", list, factory=list),
+    config_json=Field("config", _compact),
+    actions_json=Field("actions", _compact),
+)
+_MODULE_UPDATE: Schema[ModuleUpdateResponse] = Schema(
+    ModuleUpdateResponse,
+    module=Field("module", _intern),
+    result=Field("result", bool, default=False),
+    remote=Field("remote", str, default=""),
+    lsremote=Field("lsremote", str, default=""),
+    behind=Field("behind", int, default=0),
+)
+_MODULE_RESPONSE: Schema[ModuleResponse] = Schema(
+    ModuleResponse,
+    success=Field("success", bool, default=False),
+    data=Field("data", _list_of(_MODULE_DATA), factory=list),
+)
+_MONITOR_RESPONSE: Schema[MonitorResponse] = Schema(
+    MonitorResponse,
+    success=Field("success", bool, default=False),
+    monitor=Field("monitor", str),
+)
+_QUERY: Schema[Query] = Schema(Query, data=Field("data", str))
+_MODULE_UPDATE_RESPONSES: Schema[ModuleUpdateResponses] = Schema(
+    ModuleUpdateResponses,
+    success=Field("success", bool, default=False),
+    result=Field("result", _list_of(_MODULE_UPDATE), factory=list),
+)
+_QUERY_RESPONSE: Schema[QueryResponse] = Schema(
+    QueryResponse,
+    success=Field("success", bool, default=False),
+    result=Field("result"),
+    query=Field("query", _QUERY, factory=lambda: _QUERY(None)),
+)
+_MAGIC_MIRROR_DATA: Schema[MagicMirrorData] = Schema(
+    MagicMirrorData,
+    monitor_status=Field("monitor_status", str),
+    brightness=Field("brightness", int),
+    modules=Field("modules", _list_of(_MODULE_DATA), factory=list),
+)
+_MAGIC_MIRROR_UPDATE_DATA: Schema[MagicMirrorUpdateData] = Schema(
+    MagicMirrorUpdateData,
+    update_available=Field("update_available", bool, default=False),
+    module_updates=Field("module_updates", _list_of(_MODULE_UPDATE), factory=list),
+)
+_GENERIC_RESPONSE: Schema[GenericResponse] = Schema(
+    GenericResponse,
+    success=Field("success", bool, default=False),
+)
@@ -0,0 +1,220 @@
+"""Notification queue for MagicMirror."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+import attr
+
+from custom_components.magicmirror.const import DOMAIN, LOGGER
+from custom_components.magicmirror.models import GenericResponse
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.magicmirror.api import MagicMirrorApiClient
+
+PRIORITIES = {"low": 0, "normal": 1, "high": 2}
+DEFAULT_PRIORITY = "normal"
+
+MAX_QUEUE_SIZE = 20
+RATE = 0.5  # alerts per second
+BURST = 3
+
+
+@attr.s(auto_attribs=True)
+class PendingAlert:
+    """Class representing an alert waiting to be sent."""
+
+    title: str
+    msg: str
+    timer: int
+    dropdown: bool
+    priority: int
+    sequence: int
+    future: asyncio.Future[bool] = attr.ib(eq=False, repr=False)
+    merged: int = 0
+
+    @property
+    def key(self) -> tuple[str, str, bool]:
+        """Return what makes two alerts identical."""
+        return (self.title, self.msg, self.dropdown)
+
+
+@attr.s(auto_attribs=True)
+class NotificationStats:
+    """Class representing notification queue statistics."""
+
+    sent: int = 0
+    failed: int = 0
+    merged: int = 0
+    dropped: int = 0
+    max_depth: int = 0
+
+
+class TokenBucket:
+    """Allow bursts of up to burst tokens, refilled at rate per second."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize token bucket."""
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay(self) -> float:
+        """Return seconds until a token is available."""
+        self._refill()
+        return max(0.0, (1 - self._tokens) / self.rate)
+
+    def take(self) -> None:
+        """Take a token."""
+        self._refill()
+        self._tokens -= 1
+
+
+class MagicMirrorNotificationQueue:
+    """Queue alerts for one mirror, sent highest priority first and rate limited."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: MagicMirrorApiClient,
+        rate: float = RATE,
+        burst: int = BURST,
+        max_size: int = MAX_QUEUE_SIZE,
+    ) -> None:
+        """Initialize queue."""
+        self._hass = hass
+        self._api = api
+        self.max_size = max_size
+        self.stats = NotificationStats()
+
+        self._bucket = TokenBucket(rate, burst)
+        self._pending: list[PendingAlert] = []
+        self._sequence = 0
+        self._worker: asyncio.Task | None = None
+
+    @property
+    def depth(self) -> int:
+        """Return the number of pending alerts."""
+        return len(self._pending)
+
+    def enqueue(
+        self,
+        title: str,
+        msg: str,
+        timer: int,
+        *,
+        dropdown: bool = False,
+        priority: str = DEFAULT_PRIORITY,
+    ) -> asyncio.Future[bool]:
+        """Queue an alert, returning a future resolved with its delivery."""
+        level = PRIORITIES.get(priority, PRIORITIES[DEFAULT_PRIORITY])
+
+        # An alert identical to one still pending is merged rather than shown twice
+        for pending in self._pending:
+            if pending.key == (title, msg, dropdown):
+                pending.priority = max(pending.priority, level)
+                pending.timer = max(pending.timer, timer)
+                pending.merged += 1
+                self.stats.merged += 1
+                return pending.future
+
+        future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._sequence += 1
+        alert = PendingAlert(title, msg, timer, dropdown, level, self._sequence, future)
+
+        # When full, the oldest of the lowest priority alerts is dropped
+        if len(self._pending) >= self.max_size:
+            lowest = min(self._pending, key=lambda item: (item.priority, item.sequence))
+            if level < lowest.priority:
+                LOGGER.debug("Notification queue full, dropping %s", alert)
+                self.stats.dropped += 1
+                future.set_result(False)
+                return future
+
+            LOGGER.debug("Notification queue full, dropping %s", lowest)
+            self._pending.remove(lowest)
+            self.stats.dropped += 1
+            if not lowest.future.done():
+                lowest.future.set_result(False)
+
+        self._pending.append(alert)
+        self.stats.max_depth = max(self.stats.max_depth, self.depth)
+
+        if self._worker is None:
+            self._worker = self._hass.async_create_background_task(
+                self._async_run(), f"{DOMAIN} notifications {self._api.base_url}"
+            )
+
+        return future
+
+    async def _async_run(self) -> None:
+        """Send pending alerts as the rate limit allows."""
+        alert: PendingAlert | None = None
+        try:
+            while self._pending:
+                if (delay := self._bucket.delay()) > 0:
+                    await asyncio.sleep(delay)
+                    continue
+
+                alert = max(
+                    self._pending, key=lambda item: (item.priority, -item.sequence)
+                )
+                self._pending.remove(alert)
+                self._bucket.take()
+
+                delivered = await self._async_send(alert)
+                if delivered:
+                    self.stats.sent += 1
+                else:
+                    self.stats.failed += 1
+                if not alert.future.done():
+                    alert.future.set_result(delivered)
+        finally:
+            # A cancelled worker fails the alert it was sending
+            if alert is not None and not alert.future.done():
+                alert.future.set_result(False)
+            if self._worker is asyncio.current_task():
+                self._worker = None
+
+    async def _async_send(self, alert: PendingAlert) -> bool:
+        """Send an alert, returning whether the mirror accepted it."""
+        try:
+            response = GenericResponse.from_dict(
+                await self._api.alert(
+                    title=alert.title,
+                    msg=alert.msg,
+                    timer=alert.timer,
+                    dropdown=alert.dropdown,
+                )
+            )
+        except Exception as error:  # noqa: BLE001
+            LOGGER.warning("Failed to send notification to MagicMirror: %s", error)
+            return False
+
+        return response.success
+
+    async def async_close(self) -> None:
+        """Stop sending, failing the pending alerts."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+        for alert in self._pending:
+            if not alert.future.done():
+                alert.future.set_result(False)
+        self._pending.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the queue state for diagnostics."""
+        return {"depth": self.depth, **attr.asdict(self.stats)}
@@ -2,24 +2,40 @@
 
 import asyncio
 import logging
+import time
 from typing import Any
 
 import voluptuous as vol
+from async_timeout import timeout
 from homeassistant.components.notify import PLATFORM_SCHEMA
-from homeassistant.components.notify.const import ATTR_TITLE
+from homeassistant.components.notify.const import ATTR_TARGET, ATTR_TITLE
 from homeassistant.components.notify.legacy import BaseNotificationService
+from homeassistant.core import HomeAssistant
 
-from custom_components.magicmirror.const import ATTR_CONFIG_ENTRY_ID, DOMAIN
-from custom_components.magicmirror.coordinator import MagicMirrorDataUpdateCoordinator
+from custom_components.magicmirror.const import (
+    ATTR_BROADCAST,
+    ATTR_CONFIG_ENTRY_ID,
+    DOMAIN,
+    EVENT_BROADCAST,
+)
+from custom_components.magicmirror.coordinator import MagicMirrorRuntimeData
+from custom_components.magicmirror.notification_queue import (
+    DEFAULT_PRIORITY,
+    MagicMirrorNotificationQueue,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 CONF_TIMER = "timer"
 CONF_DROPDOWN = "dropdown"
+CONF_PRIORITY = "priority"
 
 DEFAULT_TIMER = 5000
 DEFAULT_DROPDOWN = False
 
+BROADCAST_CONCURRENCY = 8
+BROADCAST_TIMEOUT = 10
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {vol.Required(CONF_TIMER): vol.Coerce(int), vol.Required(CONF_DROPDOWN): str}
 )
@@ -27,10 +43,12 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
 
 async def async_get_service(hass, _, discovery_info=None):
     """Get the MagicMirror notification service."""
+    if discovery_info.get(ATTR_BROADCAST):
+        return MagicMirrorBroadcastNotificationService(hass)
 
     entry_id = discovery_info[ATTR_CONFIG_ENTRY_ID]
-    coordinator: MagicMirrorDataUpdateCoordinator = hass.data[DOMAIN][entry_id]
-    return MagicMirrorNotificationService(coordinator.api)
+    runtime_data: MagicMirrorRuntimeData = hass.data[DOMAIN][entry_id]
+    return MagicMirrorNotificationService(runtime_data.notifications)
 
 
 class MagicMirrorNotificationService(BaseNotificationService):
@@ -41,25 +59,115 @@ class MagicMirrorNotificationService(BaseNotificationService):
         self._notify = notify
 
     async def async_send_message(self, message: str, **kwargs: Any) -> None:
-        """Send a message to MagicMirror devices."""
+        """Queue a message for MagicMirror devices."""
+        self._notify.enqueue(**alert_arguments(message, kwargs))
+
+
+def alert_arguments(message: str, kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Return the alert arguments for a notify call."""
+    data = kwargs.get("data")
 
-        title = kwargs.get(ATTR_TITLE, "")
+    if data is None:
+        timer = DEFAULT_TIMER
+        alert_type = DEFAULT_DROPDOWN
+        priority = DEFAULT_PRIORITY
+    else:
+        timer = data.get(CONF_TIMER, DEFAULT_TIMER)
+        alert_type = data.get(CONF_DROPDOWN, DEFAULT_DROPDOWN)
+        priority = data.get(CONF_PRIORITY, DEFAULT_PRIORITY)
 
-        data = kwargs["data"]
+    return {
+        "title": kwargs.get(ATTR_TITLE, ""),
+        "msg": message,
+        "timer": int(timer),
+        "dropdown": bool(alert_type),
+        "priority": priority,
+    }
 
-        if data is None:
-            timer = DEFAULT_TIMER
-            alert_type = DEFAULT_DROPDOWN
-        else:
-            timer = data.get(CONF_TIMER, DEFAULT_TIMER)
-            alert_type = data.get(CONF_DROPDOWN, DEFAULT_DROPDOWN)
 
-        try:
-            await self._notify.alert(
-                title=title,
-                msg=message,
-                timer=timer,
-                dropdown=bool(alert_type),
+class MagicMirrorBroadcastNotificationService(BaseNotificationService):
+    """Send one notification to many MagicMirror devices at once."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the service."""
+        self._hass = hass
+        self._semaphore = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+
+    def _mirrors(self) -> dict[str, MagicMirrorRuntimeData]:
+        """Return the runtime data of all mirrors by entry id."""
+        return {
+            entry_id: runtime_data
+            for entry_id, runtime_data in self._hass.data.get(DOMAIN, {}).items()
+            if isinstance(runtime_data, MagicMirrorRuntimeData)
+        }
+
+    @property
+    def targets(self) -> dict[str, str]:
+        """Return the mirrors that can be targeted, by name."""
+        return {
+            runtime_data.coordinator.mirror_name: entry_id
+            for entry_id, runtime_data in self._mirrors().items()
+        }
+
+    async def async_send_message(self, message: str, **kwargs: Any) -> None:
+        """Send a message to a group of MagicMirror devices."""
+        # Without a target the alert goes to every mirror
+        mirrors = self._mirrors()
+        if targets := kwargs.get(ATTR_TARGET):
+            names = self.targets
+            selected = {names.get(target, target) for target in targets}
+            mirrors = {
+                entry_id: runtime_data
+                for entry_id, runtime_data in mirrors.items()
+                if entry_id in selected
+            }
+
+        arguments = alert_arguments(message, kwargs)
+        start = time.monotonic()
+        results = await asyncio.gather(
+            *(
+                self._async_alert(runtime_data.notifications, arguments)
+                for runtime_data in mirrors.values()
             )
-        except asyncio.TimeoutError:
-            _LOGGER.error("Timeout sending message with MagicMirror")
+        )
+        latency = time.monotonic() - start
+
+        delivered = {
+            runtime_data.coordinator.mirror_name: result
+            for runtime_data, result in zip(mirrors.values(), results, strict=True)
+        }
+        failed = [name for name, result in delivered.items() if not result["success"]]
+        if failed:
+            _LOGGER.warning("Broadcast not delivered to %s", ", ".join(failed))
+
+        self._hass.bus.async_fire(
+            EVENT_BROADCAST,
+            {
+                "message": message,
+                "results": delivered,
+                "delivered": len(delivered) - len(failed),
+                "failed": len(failed),
+                "latency": latency,
+            },
+        )
+
+    async def _async_alert(
+        self, notifications: MagicMirrorNotificationQueue, arguments: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Send an alert to a single mirror, returning the delivery result."""
+        async with self._semaphore:
+            start = time.monotonic()
+            error = None
+            try:
+                async with timeout(BROADCAST_TIMEOUT):
+                    # Shielded, as merged alerts share the future
+                    success = await asyncio.shield(notifications.enqueue(**arguments))
+            except Exception as err:  # noqa: BLE001
+                success = False
+                error = str(err) or type(err).__name__
+
+            return {
+                "success": success,
+                "latency": time.monotonic() - start,
+                "error": error,
+            }
@@ -0,0 +1,82 @@
+"""Push mode for MagicMirror."""
+
+from __future__ import annotations
+
+from functools import partial
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from aiohttp import hdrs, web
+from homeassistant.components import webhook
+from homeassistant.const import CONF_WEBHOOK_ID, STATE_OFF, STATE_ON
+
+from custom_components.magicmirror.const import DOMAIN, LOGGER, PUSH_SCAN_INTERVAL
+from custom_components.magicmirror.models import Entity
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.magicmirror.coordinator import (
+        MagicMirrorDataUpdateCoordinator,
+    )
+
+DELTA_SCHEMA = vol.Schema(
+    {
+        vol.Optional(Entity.MONITOR_STATUS.value): vol.In([STATE_ON, STATE_OFF]),
+        vol.Optional(Entity.BRIGHTNESS.value): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=100)
+        ),
+        vol.Optional(Entity.MODULES.value): {str: {vol.Required("hidden"): bool}},
+    }
+)
+
+
+async def async_setup_push(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: MagicMirrorDataUpdateCoordinator,
+) -> None:
+    """Register the webhook the mirror pushes state deltas to."""
+    webhook_id = entry.data.get(CONF_WEBHOOK_ID)
+    if webhook_id is None:
+        webhook_id = webhook.async_generate_id()
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_WEBHOOK_ID: webhook_id}
+        )
+
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        f"MagicMirror {coordinator.mirror_name}",
+        webhook_id,
+        partial(handle_webhook, coordinator),
+        local_only=True,
+        allowed_methods=[hdrs.METH_POST],
+    )
+    entry.async_on_unload(partial(webhook.async_unregister, hass, webhook_id))
+
+    # Pushed deltas are applied directly, polling is only a safety net
+    coordinator.base_interval = PUSH_SCAN_INTERVAL
+    coordinator.update_interval = PUSH_SCAN_INTERVAL
+    LOGGER.debug("Push mode enabled at %s", webhook.async_generate_path(webhook_id))
+
+
+async def handle_webhook(
+    coordinator: MagicMirrorDataUpdateCoordinator,
+    _hass: HomeAssistant,
+    _webhook_id: str,
+    request: web.Request,
+) -> web.Response:
+    """Handle a state delta pushed by the mirror."""
+    try:
+        delta = DELTA_SCHEMA(await request.json())
+    except (ValueError, vol.Invalid) as error:
+        LOGGER.warning("Invalid push from MagicMirror: %s", error)
+        return web.Response(status=HTTPStatus.BAD_REQUEST)
+
+    LOGGER.debug("Push delta=%s", delta)
+    coordinator.async_apply_delta(delta)
+
+    return web.Response(status=HTTPStatus.OK)
@@ -0,0 +1,122 @@
+"""Fleet poll scheduler for MagicMirror."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import attr
+
+from custom_components.magicmirror.const import MAX_CONCURRENT_POLLS
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+# Golden ratio conjugate, spreads slots evenly however many are registered
+SLOT_STEP = (math.sqrt(5) - 1) / 2
+
+
+@attr.s(auto_attribs=True)
+class FleetStats:
+    """Class representing fleet-wide poll statistics."""
+
+    polls: int = 0
+    failures: int = 0
+    running: int = 0
+    max_running: int = 0
+    waiting: int = 0
+    max_waiting: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    total_duration: float = 0.0
+
+    @property
+    def average_wait(self) -> float | None:
+        """Return the average time a poll waited for a free slot."""
+        return self.total_wait / self.polls if self.polls else None
+
+    @property
+    def average_duration(self) -> float | None:
+        """Return the average poll duration in seconds."""
+        return self.total_duration / self.polls if self.polls else None
+
+
+class MagicMirrorFleetScheduler:
+    """Spread the polls of all configured mirrors, limiting how many run at once."""
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_POLLS) -> None:
+        """Initialize scheduler."""
+        self.max_concurrent = max_concurrent
+        self.stats = FleetStats()
+
+        self._epoch = time.monotonic()
+        self._slots: dict[Any, int] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    def register(self, owner: Any) -> float:
+        """Assign a slot, returning its phase as a fraction of the interval."""
+        # Mirrors set up together drift apart instead of polling in lockstep
+        if owner not in self._slots:
+            taken = set(self._slots.values())
+            self._slots[owner] = next(
+                index for index in range(len(taken) + 1) if index not in taken
+            )
+        return (self._slots[owner] * SLOT_STEP) % 1
+
+    def unregister(self, owner: Any) -> None:
+        """Release the slot of an owner."""
+        self._slots.pop(owner, None)
+
+    def next_delay(self, phase: float, interval: timedelta) -> timedelta:
+        """Return the delay until the next slot at least half an interval away."""
+        seconds = interval.total_seconds()
+        if seconds <= 0:
+            return interval
+
+        elapsed = time.monotonic() - self._epoch - phase * seconds
+        delay = seconds - elapsed % seconds
+        if delay < seconds / 2:
+            delay += seconds
+        return timedelta(seconds=delay)
+
+    @asynccontextmanager
+    async def async_poll(self) -> AsyncIterator[None]:
+        """Wait for a free poll slot and hold it while polling."""
+        stats = self.stats
+        start = time.monotonic()
+        stats.waiting += 1
+        stats.max_waiting = max(stats.max_waiting, stats.waiting)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            stats.waiting -= 1
+
+        started = time.monotonic()
+        stats.running += 1
+        stats.max_running = max(stats.max_running, stats.running)
+        stats.total_wait += started - start
+        stats.max_wait = max(stats.max_wait, started - start)
+        try:
+            yield
+        except Exception:
+            stats.failures += 1
+            raise
+        finally:
+            stats.running -= 1
+            stats.polls += 1
+            stats.total_duration += time.monotonic() - started
+            self._semaphore.release()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the scheduler state for diagnostics."""
+        return {
+            "mirrors": len(self._slots),
+            "max_concurrent": self.max_concurrent,
+            **attr.asdict(self.stats),
+            "average_wait": self.stats.average_wait,
+            "average_duration": self.stats.average_duration,
+        }
@@ -0,0 +1,149 @@
+"""Sensor entity for MagicMirror."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from custom_components.magicmirror.const import DOMAIN
+from custom_components.magicmirror.coordinator import (
+    MagicMirrorDataUpdateCoordinator,
+    MagicMirrorRuntimeData,
+)
+from custom_components.magicmirror.entity import MagicMirrorEntity
+from custom_components.magicmirror.metrics import RequestMetrics
+from custom_components.magicmirror.models import Entity
+
+# The metrics change on every poll, also when the polled data does not
+SCAN_INTERVAL = timedelta(minutes=1)
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    """Convert seconds to rounded milliseconds."""
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+@dataclass(frozen=True, kw_only=True)
+class MagicMirrorSensorEntityDescription(SensorEntityDescription):
+    """Describes a MagicMirror poll metric sensor."""
+
+    value_fn: Callable[[RequestMetrics], float | None]
+
+
+SENSORS = (
+    MagicMirrorSensorEntityDescription(
+        key=Entity.POLL_LATENCY_P50.value,
+        name="MagicMirror Poll Latency p50",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda metrics: _milliseconds(metrics.percentile(50)),
+    ),
+    MagicMirrorSensorEntityDescription(
+        key=Entity.POLL_LATENCY_P95.value,
+        name="MagicMirror Poll Latency p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda metrics: _milliseconds(metrics.percentile(95)),
+    ),
+    MagicMirrorSensorEntityDescription(
+        key=Entity.LAST_POLL_DURATION.value,
+        name="MagicMirror Last Poll Duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda metrics: _milliseconds(metrics.last_latency),
+    ),
+    MagicMirrorSensorEntityDescription(
+        key=Entity.AVAILABILITY.value,
+        name="MagicMirror Availability",
+        icon="mdi:lan-connect",
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=1,
+        value_fn=lambda metrics: metrics.availability,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Add MagicMirror entities from a config_entry."""
+    runtime_data: MagicMirrorRuntimeData = hass.data[DOMAIN][entry.entry_id]
+    coordinator = runtime_data.coordinator
+
+    async_add_entities(
+        MagicMirrorPollSensor(coordinator, description, entry.entry_id)
+        for description in SENSORS
+    )
+
+
+class MagicMirrorPollSensor(MagicMirrorEntity, SensorEntity):
+    """Define a MagicMirror poll metric sensor."""
+
+    coordinator: MagicMirrorDataUpdateCoordinator
+    entity_description: MagicMirrorSensorEntityDescription
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: MagicMirrorDataUpdateCoordinator,
+        description: MagicMirrorSensorEntityDescription,
+        entry_id: str,
+    ) -> None:
+        """Initialize."""
+        super().__init__(coordinator)
+        self.coordinator = coordinator
+        self.entity_description = description
+        self._attr_unique_id = f"{entry_id}_{description.key}"
+        self._attr_device_info = coordinator._attr_device_info  # noqa: SLF001
+
+        self.update_from_data()
+
+    @property
+    def should_poll(self) -> bool:
+        """Return True, the metrics are read on the platform's interval."""
+        # Listeners are only notified when the polled data changes
+        return True
+
+    @property
+    def assumed_state(self) -> bool:
+        """Return False, the metrics are never restored."""
+        return False
+
+    @property
+    def available(self) -> bool:
+        """Return True, the metrics are known even if the mirror is not."""
+        # Stay available so the drop in availability can be seen
+        return True
+
+    async def async_update(self) -> None:
+        """Read the current metrics."""
+        self.update_from_data()
+
+    def update_from_data(self) -> None:
+        """Update sensor data."""
+        self._attr_native_value = self.entity_description.value_fn(
+            self.coordinator.poll_metrics
+        )
+
+    def state_key(self) -> tuple[Any, ...]:
+        """Return the values this entity renders from coordinator data."""
+        return (self._attr_native_value,)
+
+    def restore_state(self, state: tuple[Any, ...]) -> None:
+        """Restore values previously returned by state_key."""
+        (self._attr_native_value,) = state
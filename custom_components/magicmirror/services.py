@@ -0,0 +1,113 @@
+"""Services for MagicMirror."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import attr
+import voluptuous as vol
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.magicmirror.const import ATTR_CONFIG_ENTRY_ID, DOMAIN, LOGGER
+from custom_components.magicmirror.coordinator import MagicMirrorRuntimeData
+from custom_components.magicmirror.models import Services
+
+ATTR_CYCLES = "cycles"
+
+DEFAULT_PROFILE_CYCLES = 5
+MAX_PROFILE_CYCLES = 20
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CYCLES, default=DEFAULT_PROFILE_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PROFILE_CYCLES)
+        ),
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): str,
+    }
+)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the MagicMirror services."""
+
+    async def async_profile(call: ServiceCall) -> ServiceResponse:
+        """Profile the polls of one or all mirrors."""
+        mirrors = {
+            entry_id: runtime_data
+            for entry_id, runtime_data in hass.data.get(DOMAIN, {}).items()
+            if isinstance(runtime_data, MagicMirrorRuntimeData)
+        }
+        if entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID):
+            if entry_id not in mirrors:
+                exception = f"No MagicMirror with entry {entry_id}"
+                raise ServiceValidationError(exception)
+            mirrors = {entry_id: mirrors[entry_id]}
+
+        profiles = await asyncio.gather(
+            *(
+                async_profile_mirror(runtime_data, call.data[ATTR_CYCLES])
+                for runtime_data in mirrors.values()
+            )
+        )
+        return dict(zip(mirrors, profiles, strict=True))
+
+    hass.services.async_register(
+        DOMAIN,
+        Services.PROFILE.value,
+        async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+async def async_profile_mirror(
+    runtime_data: MagicMirrorRuntimeData, cycles: int
+) -> dict[str, Any]:
+    """Poll a mirror back to back, recording what each poll cycle took."""
+    coordinator = runtime_data.coordinator
+    LOGGER.debug("Profiling %s over %s poll cycles", coordinator.mirror_name, cycles)
+
+    results: list[dict[str, Any]] = []
+    started_at = time.time()
+    start = time.monotonic()
+    for _ in range(cycles):
+        cycle_started_at = time.time()
+        cycle_start = time.monotonic()
+        await coordinator.async_refresh()
+        results.append(
+            {
+                "duration": time.monotonic() - cycle_start,
+                "success": coordinator.last_update_success,
+                "poll": (
+                    attr.asdict(coordinator.poll_traces[-1])
+                    if coordinator.poll_traces
+                    else None
+                ),
+                "requests": [
+                    attr.asdict(trace)
+                    for trace in coordinator.api.traces
+                    if trace.start >= cycle_started_at
+                ],
+            }
+        )
+
+    durations = [result["duration"] for result in results]
+    runtime_data.profile = {
+        "name": coordinator.mirror_name,
+        "start": started_at,
+        "duration": time.monotonic() - start,
+        "cycles": cycles,
+        "failed": sum(not result["success"] for result in results),
+        "mean_cycle": sum(durations) / cycles,
+        "max_cycle": max(durations),
+        "results": results,
+    }
+    return runtime_data.profile
@@ -0,0 +1,93 @@
+"""Persisted state for MagicMirror."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from custom_components.magicmirror.const import DOMAIN, LOGGER
+from custom_components.magicmirror.models import (
+    MagicMirrorData,
+    MagicMirrorUpdateData,
+)
+
+if TYPE_CHECKING:
+    from custom_components.magicmirror.coordinator import (
+        MagicMirrorDataUpdateCoordinator,
+        MagicMirrorUpdateCoordinator,
+    )
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
+
+class MagicMirrorSnapshot:
+    """Persist the last known state of a mirror, to set up without waiting for it."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize snapshot."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+
+    async def async_load(
+        self,
+    ) -> tuple[MagicMirrorData, MagicMirrorUpdateData | None] | None:
+        """Load the snapshot, with update availability once it was checked."""
+        try:
+            snapshot = await self._store.async_load()
+        except Exception as error:  # noqa: BLE001
+            LOGGER.debug("Ignoring unreadable MagicMirror snapshot: %s", error)
+            return None
+
+        if not snapshot or not snapshot.get("data"):
+            return None
+
+        update_data = snapshot.get("update_data")
+        return (
+            MagicMirrorData.from_dict(snapshot["data"]),
+            MagicMirrorUpdateData.from_dict(update_data) if update_data else None,
+        )
+
+    @callback
+    def async_track(
+        self,
+        coordinator: MagicMirrorDataUpdateCoordinator,
+        update_coordinator: MagicMirrorUpdateCoordinator,
+    ) -> CALLBACK_TYPE:
+        """Save the snapshot whenever the polled data changes."""
+
+        @callback
+        def _async_data_to_save() -> dict[str, Any]:
+            return {
+                "data": coordinator.data.as_dict(),
+                "update_data": (
+                    update_coordinator.data.as_dict()
+                    if update_coordinator.data is not None
+                    else None
+                ),
+            }
+
+        @callback
+        def _async_schedule_save() -> None:
+            if coordinator.data is not None:
+                self._store.async_delay_save(_async_data_to_save, SAVE_DELAY)
+
+        unsubscribers = [
+            coordinator.async_add_listener(_async_schedule_save),
+            update_coordinator.async_add_listener(_async_schedule_save),
+        ]
+        _async_schedule_save()
+
+        @callback
+        def _async_untrack() -> None:
+            for unsubscribe in unsubscribers:
+                unsubscribe()
+
+        return _async_untrack
+
+    async def async_remove(self) -> None:
+        """Remove the snapshot."""
+        await self._store.async_remove()
@@ -3,18 +3,21 @@
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import (
     ToggleEntity,
     ToggleEntityDescription,
 )
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from custom_components.magicmirror.const import DOMAIN, LOGGER
-from custom_components.magicmirror.coordinator import MagicMirrorDataUpdateCoordinator
-from custom_components.magicmirror.models import ModuleDataResponse
+from custom_components.magicmirror.coordinator import (
+    MagicMirrorDataUpdateCoordinator,
+    MagicMirrorRuntimeData,
+)
+from custom_components.magicmirror.entity import MagicMirrorEntity
+from custom_components.magicmirror.models import Entity, ModuleDataResponse
 
 
 async def async_setup_entry(
@@ -23,7 +26,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Add MagicMirror entities from a config_entry."""
-    coordinator: MagicMirrorDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    runtime_data: MagicMirrorRuntimeData = hass.data[DOMAIN][entry.entry_id]
+    coordinator = runtime_data.coordinator
 
     async_add_entities(
         MagicMirrorModuleSwitch(coordinator, module)
@@ -31,7 +35,7 @@ async def async_setup_entry(
     )
 
 
-class MagicMirrorSwitch(CoordinatorEntity, ToggleEntity):
+class MagicMirrorSwitch(MagicMirrorEntity, ToggleEntity):
     """Define a MagicMirror entity."""
 
     sensor_data: bool
@@ -67,11 +71,13 @@ class MagicMirrorSwitch(CoordinatorEntity, ToggleEntity):
             self.entity_description.key
         )
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle data update."""
-        self.update_from_data()
-        super()._handle_coordinator_update()
+    def state_key(self) -> tuple[Any, ...]:
+        """Return the values this entity renders from coordinator data."""
+        return (self.sensor_data,)
+
+    def restore_state(self, state: tuple[Any, ...]) -> None:
+        """Restore values previously returned by state_key."""
+        (self.sensor_data,) = state
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
@@ -89,17 +95,19 @@ class MagicMirrorSwitch(CoordinatorEntity, ToggleEntity):
 class MagicMirrorModuleSwitch(MagicMirrorSwitch):
     """Define a MagicMirrorModule entity."""
 
+    refresh_keys = (Entity.MODULES,)
+
     def __init__(
         self,
         coordinator: MagicMirrorDataUpdateCoordinator,
         module: ModuleDataResponse,
     ) -> None:
         """Initialize."""
+        self.module = module
         super().__init__(
             coordinator,
             ToggleEntityDescription(key=module.name),
         )
-        self.module = module
 
         self.entity_id = f"switch.{module.identifier}"
         self._attr_name = (
@@ -119,20 +127,27 @@ class MagicMirrorModuleSwitch(MagicMirrorSwitch):
         )
 
     def update_from_data(self) -> None:
-        for module in self.coordinator.data.modules:
-            if module.name == self.entity_description.key:
-                self.sensor_data = False if module.hidden else True
-                return
-        self.sensor_data = "unknown"
+        module = self.coordinator.data.modules_by_identifier.get(self.module.identifier)
+        if module is None:
+            self.sensor_data = "unknown"
+            return
+        self.sensor_data = False if module.hidden else True
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
-        await self.coordinator.api.show_module(self.module.identifier)
         self.sensor_data = True
-        await self.coordinator.async_request_refresh()
+        await self.async_command(self._async_send(show=True))
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
-        await self.coordinator.api.hide_module(self.module.identifier)
         self.sensor_data = False
-        await self.coordinator.async_request_refresh()
+        await self.async_command(self._async_send(show=False))
+
+    async def _async_send(self, *, show: bool) -> bool:
+        """Show or hide the module, returning whether it succeeded."""
+        api = self.coordinator.api
+        if show:
+            response = await api.show_module(self.module.identifier)
+        else:
+            response = await api.hide_module(self.module.identifier)
+        return response.success
@@ -0,0 +1,192 @@
+"""Persistent socket transport for MagicMirror commands."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from async_timeout import timeout
+
+from custom_components.magicmirror.const import DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+NAMESPACE = "/MMM-Remote-Control"
+SOCKET_PATH = "socket.io/?EIO=4&transport=websocket"
+
+CONNECT_TIMEOUT = 5
+COMMAND_TIMEOUT = 5
+RECONNECT_DELAY = 60
+
+# Engine.IO / Socket.IO v4 packet prefixes
+EIO_OPEN = "0"
+EIO_PING = "2"
+EIO_PONG = "3"
+SIO_CONNECT = "40"
+SIO_EVENT = "42"
+
+REMOTE_ACTION = "REMOTE_ACTION"
+RESULT_EVENTS = ("RESULT", "REMOTE_ACTION_RESULT")
+
+
+class MagicMirrorSocketTransport:
+    """Send commands over the socket.io connection MMM-Remote-Control's UI uses."""
+
+    def __init__(
+        self, hass: HomeAssistant, session: aiohttp.ClientSession, base_url: str
+    ) -> None:
+        """Initialize transport."""
+        self._hass = hass
+        self._session = session
+        self.url = f"{base_url.replace('http', 'ws', 1)}/{SOCKET_PATH}"
+
+        self._ws: aiohttp.ClientWebSocketResponse | None = None
+        self._reader: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+        self._send_lock = asyncio.Lock()
+        self._reply: asyncio.Future[dict[str, Any] | None] | None = None
+        self._reply_action: str | None = None
+        self._retry_at = 0.0
+
+    @property
+    def connected(self) -> bool:
+        """Return true if the socket is connected."""
+        return self._ws is not None and not self._ws.closed
+
+    async def async_send(
+        self, action: str, payload: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Send a remote action, returning None if it could not be sent."""
+        if not await self._async_ensure_connected():
+            return None
+
+        message = json.dumps([REMOTE_ACTION, {"action": action, **payload}])
+        # One command at a time, each waiting for the module's reply
+        async with self._send_lock:
+            self._reply = asyncio.get_running_loop().create_future()
+            self._reply_action = action
+            try:
+                await self._ws.send_str(f"{SIO_EVENT}{NAMESPACE},{message}")
+                async with timeout(COMMAND_TIMEOUT):
+                    reply = await self._reply
+            except (aiohttp.ClientError, ConnectionResetError) as error:
+                LOGGER.debug("Socket send failed, falling back to HTTP: %s", error)
+                await self._async_disconnect()
+                return None
+            except TimeoutError:
+                reply = None
+            finally:
+                self._reply = None
+                self._reply_action = None
+
+            if reply is not None:
+                return reply
+
+            # The mirror may have run the action, so an empty reply is returned
+            # rather than None, which would have it resent over HTTP
+            LOGGER.debug("No reply to %s, using HTTP for a while", action)
+            self._retry_at = time.monotonic() + RECONNECT_DELAY
+            await self._async_disconnect()
+            return {}
+
+    async def _async_ensure_connected(self) -> bool:
+        """Connect the socket unless connected or backing off."""
+        if self.connected:
+            return True
+
+        async with self._lock:
+            if self.connected:
+                return True
+            if time.monotonic() < self._retry_at:
+                return False
+
+            try:
+                await self._async_connect()
+            except (aiohttp.ClientError, TimeoutError, TypeError, ValueError) as error:
+                LOGGER.debug("Socket connect failed, using HTTP: %s", error)
+                self._retry_at = time.monotonic() + RECONNECT_DELAY
+                await self._async_disconnect()
+                return False
+
+        return True
+
+    async def _async_connect(self) -> None:
+        """Open the websocket and join the MMM-Remote-Control namespace."""
+        async with timeout(CONNECT_TIMEOUT):
+            self._ws = await self._session.ws_connect(self.url, autoping=False)
+
+            open_packet = await self._ws.receive_str()
+            if not open_packet.startswith(EIO_OPEN):
+                exception = f"Unexpected open packet {open_packet}"
+                raise ValueError(exception)
+
+            await self._ws.send_str(f"{SIO_CONNECT}{NAMESPACE},")
+            while not (await self._ws.receive_str()).startswith(
+                f"{SIO_CONNECT}{NAMESPACE}"
+            ):
+                pass
+
+        self._reader = self._hass.async_create_background_task(
+            self._async_read(), f"{DOMAIN} socket reader {self.url}"
+        )
+        LOGGER.debug("Socket connected to %s", self.url)
+
+    async def _async_read(self) -> None:
+        """Answer pings and pass on replies until the socket closes."""
+        ws = self._ws
+        try:
+            async for message in ws:
+                if message.type != aiohttp.WSMsgType.TEXT:
+                    break
+                if message.data == EIO_PING:
+                    await ws.send_str(EIO_PONG)
+                elif message.data.startswith(f"{SIO_EVENT}{NAMESPACE},"):
+                    self._handle_event(message.data.partition(",")[2])
+        finally:
+            if self._reply is not None and not self._reply.done():
+                self._reply.set_result(None)
+        LOGGER.debug("Socket to %s closed", self.url)
+
+    def _handle_event(self, data: str) -> None:
+        """Resolve the pending command with a reply of the module."""
+        try:
+            event, *args = json.loads(data)
+        except (TypeError, ValueError):
+            LOGGER.debug("Ignoring malformed socket event %s", data)
+            return
+
+        if event not in RESULT_EVENTS or self._reply is None or self._reply.done():
+            return
+        reply = args[0] if args and isinstance(args[0], dict) else {}
+
+        # Results are broadcast to every client of the namespace, and carry no
+        # id to match them to a command. Only a reply naming another action
+        # can be told apart from ours.
+        query = reply.get("query")
+        echoed = reply.get("action") or (
+            query.get("action") if isinstance(query, dict) else None
+        )
+        if echoed is not None and echoed != self._reply_action:
+            LOGGER.debug(
+                "Ignoring result of %s, awaiting %s", echoed, self._reply_action
+            )
+            return
+        self._reply.set_result(reply)
+
+    async def _async_disconnect(self) -> None:
+        """Close the socket."""
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+
+    async def async_close(self) -> None:
+        """Close the transport."""
+        async with self._lock:
+            await self._async_disconnect()
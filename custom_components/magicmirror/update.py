@@ -5,14 +5,17 @@ from typing import Any
 from homeassistant.components.update import UpdateEntity, UpdateEntityFeature
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_ON, EntityCategory
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from custom_components.magicmirror.const import DOMAIN
-from custom_components.magicmirror.coordinator import MagicMirrorDataUpdateCoordinator
+from custom_components.magicmirror.coordinator import (
+    MagicMirrorRuntimeData,
+    MagicMirrorUpdateCoordinator,
+)
+from custom_components.magicmirror.entity import MagicMirrorEntity
 from custom_components.magicmirror.models import (
     Entity,
     ModuleDataResponse,
@@ -27,10 +30,12 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up the MagicMirror update entities."""
-    coordinator: MagicMirrorDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    runtime_data: MagicMirrorRuntimeData = hass.data[DOMAIN][entry.entry_id]
+    coordinator = runtime_data.update_coordinator
 
-    async_add_entities(
-        [
+    @callback
+    def _async_add_update_entities() -> None:
+        update_entities: list[MagicMirrorEntity] = [
             MagicMirrorUpdate(
                 coordinator,
                 EntityDescription(
@@ -39,31 +44,48 @@ async def async_setup_entry(
                 ),
             )
         ]
-    )
 
-    coordinator: MagicMirrorDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    modules = list(coordinator.data.modules)
-    updates = list(coordinator.data.module_updates)
-
-    update_entities: list[MagicMirrorModuleUpdate] = []
-    for module in modules:
-        for update in updates:
-            if module.name == update.module:
+        updates = coordinator.data.module_updates_by_name
+        for module in runtime_data.coordinator.data.modules:
+            update = updates.get(module.name)
+            if update is not None:
                 update_entities.append(
                     MagicMirrorModuleUpdate(coordinator, module, update)
                 )
 
-    async_add_entities(update_entities)
+        async_add_entities(update_entities)
+
+    # Unless restored, the entities are added once the first update check finished
+    if coordinator.data is not None:
+        _async_add_update_entities()
+        return
+
+    unsubscribers: list[CALLBACK_TYPE] = []
+
+    @callback
+    def _async_first_update_check() -> None:
+        if coordinator.data is None:
+            return
+        _async_cancel()
+        _async_add_update_entities()
+
+    @callback
+    def _async_cancel() -> None:
+        while unsubscribers:
+            unsubscribers.pop()()
+
+    unsubscribers.append(coordinator.async_add_listener(_async_first_update_check))
+    entry.async_on_unload(_async_cancel)
 
 
-class MagicMirrorUpdate(CoordinatorEntity, UpdateEntity):
+class MagicMirrorUpdate(MagicMirrorEntity, UpdateEntity):
     """MagicMirror Update class."""
 
-    coordinator: MagicMirrorDataUpdateCoordinator
+    coordinator: MagicMirrorUpdateCoordinator
 
     def __init__(
         self,
-        coordinator: MagicMirrorDataUpdateCoordinator,
+        coordinator: MagicMirrorUpdateCoordinator,
         description: EntityDescription,
     ) -> None:
         """Initialize update entity."""
@@ -91,11 +113,13 @@ class MagicMirrorUpdate(CoordinatorEntity, UpdateEntity):
         state = self.coordinator.data.__getattribute__(self.entity_description.key)
         return state == STATE_ON
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle data update."""
+    def update_from_data(self) -> None:
+        """Update sensor data."""
         self.sensor_data = self.get_sensor_data()
-        super()._handle_coordinator_update()
+
+    def state_key(self) -> tuple[Any, ...]:
+        """Return the values this entity renders from coordinator data."""
+        return (self.sensor_data,)
 
     @property
     def installed_version(self) -> str:
@@ -103,15 +127,15 @@ class MagicMirrorUpdate(CoordinatorEntity, UpdateEntity):
         return OLD_VERSION if self.sensor_data else LATEST_VERSION
 
 
-class MagicMirrorModuleUpdate(CoordinatorEntity, UpdateEntity):
+class MagicMirrorModuleUpdate(MagicMirrorEntity, UpdateEntity):
     """MagicMirror Module Update class."""
 
     module: ModuleDataResponse
-    coordinator: MagicMirrorDataUpdateCoordinator
+    coordinator: MagicMirrorUpdateCoordinator
 
     def __init__(
         self,
-        coordinator: MagicMirrorDataUpdateCoordinator,
+        coordinator: MagicMirrorUpdateCoordinator,
         module: ModuleDataResponse,
         update: ModuleUpdateResponse,
     ) -> None:
@@ -133,16 +157,15 @@ class MagicMirrorModuleUpdate(CoordinatorEntity, UpdateEntity):
 
     def get_sensor_data(self) -> ModuleUpdateResponse | None:
         """Get sensor data."""
-        for module in self.coordinator.data.module_updates:
-            if self.module.name == module.module:
-                return module
-        return None
+        return self.coordinator.data.module_updates_by_name.get(self.module.name)
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle data update."""
+    def update_from_data(self) -> None:
+        """Update sensor data."""
         self.sensor_data = self.get_sensor_data()
-        super()._handle_coordinator_update()
+
+    def state_key(self) -> tuple[Any, ...]:
+        """Return the values this entity renders from coordinator data."""
+        return (self.sensor_data,)
 
     async def async_install(
         self, version: str | None, backup: bool, **kwargs: Any
@@ -151,6 +174,7 @@ class MagicMirrorModuleUpdate(CoordinatorEntity, UpdateEntity):
         self._attr_in_progress = True
         await self.coordinator.api.module_update(self.module.name)
         self._attr_in_progress = False
+        await self.coordinator.async_request_partial_refresh([Entity.MODULE_UPDATES])
 
     @property
     def installed_version(self) -> str:
@@ -0,0 +1,120 @@
+"""Fixtures for MagicMirror tests."""
+
+import json
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import attr
+import pytest
+from aiohttp import WSMsgType, web
+from aiohttp.test_utils import TestServer
+
+from custom_components.magicmirror.transport import (
+    EIO_OPEN,
+    NAMESPACE,
+    SIO_CONNECT,
+    SIO_EVENT,
+)
+
+DATA = Path(__file__).parent / "data"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:  # noqa: ARG001
+    """Enable loading the custom integration in all tests."""
+    return
+
+
+def load_json(name: str) -> dict[str, Any]:
+    """Load a response from the test data."""
+    return json.loads((DATA / name).read_text())
+
+
+@attr.s(auto_attribs=True)
+class StandInMirror:
+    """Class representing a local stand-in for MMM-Remote-Control."""
+
+    server: TestServer | None = None
+    socket_enabled: bool = True
+    socket_reply: dict[str, Any] | None = attr.ib(factory=lambda: {"success": True})
+    # Results of other clients' commands, broadcast before the reply
+    socket_broadcasts: list[dict[str, Any]] = attr.ib(factory=list)
+    http_actions: list[str] = attr.ib(factory=list)
+    socket_actions: list[dict[str, Any]] = attr.ib(factory=list)
+
+    @property
+    def host(self) -> str:
+        """Return the host the server listens on."""
+        return self.server.host
+
+    @property
+    def port(self) -> str:
+        """Return the port the server listens on."""
+        return str(self.server.port)
+
+    @property
+    def base_url(self) -> str:
+        """Return the base url of the server."""
+        return f"http://{self.host}:{self.port}"
+
+
+def _app(mirror: StandInMirror) -> web.Application:
+    """Return an app answering the API and socket.io like the mirror."""
+
+    def respond(name: str) -> Callable[[web.Request], Awaitable[web.Response]]:
+        async def handler(_: web.Request) -> web.Response:
+            return web.json_response(load_json(name))
+
+        return handler
+
+    async def module_action(request: web.Request) -> web.Response:
+        mirror.http_actions.append(request.match_info["action"])
+        return web.json_response(load_json("test.json"))
+
+    async def socket(request: web.Request) -> web.StreamResponse:
+        if not mirror.socket_enabled:
+            raise web.HTTPNotFound
+
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await ws.send_str(f'{EIO_OPEN}{{"sid":"stand-in","pingInterval":25000}}')
+
+        async for message in ws:
+            if message.type != WSMsgType.TEXT:
+                break
+            if message.data.startswith(f"{SIO_CONNECT}{NAMESPACE}"):
+                await ws.send_str(f'{SIO_CONNECT}{NAMESPACE},{{"sid":"stand-in"}}')
+            elif message.data.startswith(f"{SIO_EVENT}{NAMESPACE},"):
+                _, payload = json.loads(message.data.partition(",")[2])
+                mirror.socket_actions.append(payload)
+                for result in mirror.socket_broadcasts:
+                    broadcast = json.dumps(["REMOTE_ACTION_RESULT", result])
+                    await ws.send_str(f"{SIO_EVENT}{NAMESPACE},{broadcast}")
+                if mirror.socket_reply is not None:
+                    reply = json.dumps(["REMOTE_ACTION_RESULT", mirror.socket_reply])
+                    await ws.send_str(f"{SIO_EVENT}{NAMESPACE},{reply}")
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/api/monitor/status", respond("monitor_status.json"))
+    app.router.add_get("/api/monitor/on", respond("monitor_on.json"))
+    app.router.add_get("/api/monitor/off", respond("monitor_off.json"))
+    app.router.add_get("/api/brightness", respond("brightness_get.json"))
+    app.router.add_get("/api/brightness/{value}", respond("brightness_set.json"))
+    app.router.add_get("/api/module", respond("module.json"))
+    app.router.add_get("/api/module/{module}/{action}", module_action)
+    app.router.add_get("/socket.io/", socket)
+    return app
+
+
+@pytest.fixture
+async def stand_in_mirror(
+    socket_enabled: None,  # noqa: ARG001
+) -> AsyncGenerator[StandInMirror, None]:
+    """Run a local stand-in mirror, allowing sockets for it."""
+    mirror = StandInMirror()
+    mirror.server = TestServer(_app(mirror))
+    await mirror.server.start_server()
+    yield mirror
+    await mirror.server.close()
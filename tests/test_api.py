@@ -0,0 +1,79 @@
+"""Tests for the MagicMirror API client."""
+
+import asyncio
+import json
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.magicmirror.api import (
+    EXECUTOR_DECODE_THRESHOLD,
+    SESSION_CONNECTION_LIMIT,
+    MagicMirrorApiClient,
+)
+from custom_components.magicmirror.coordinator import MagicMirrorDataUpdateCoordinator
+from custom_components.magicmirror.models import GenericResponse, ModuleResponse
+from tests.conftest import StandInMirror, load_json
+
+POLLS = 2
+
+
+async def test_dedicated_session_reuses_connections(
+    hass: HomeAssistant, stand_in_mirror: StandInMirror
+) -> None:
+    """Test the dedicated session reuses its connections across polls."""
+    api = MagicMirrorApiClient(stand_in_mirror.host, stand_in_mirror.port, "key")
+    api.create_session()
+    coordinator = MagicMirrorDataUpdateCoordinator(hass, api, "Mirror")
+
+    for _ in range(POLLS):
+        await coordinator.async_fetch_fields(list(coordinator.fetchers))
+    await api.async_close()
+
+    requests = POLLS * len(coordinator.fetchers)
+    stats = api.connection_stats
+    assert stats.created + stats.reused == requests
+    assert stats.created <= SESSION_CONNECTION_LIMIT
+    assert stats.reused > 0
+
+
+async def test_decode_stats_by_payload_size() -> None:
+    """Test inline and offloaded decodes are both timed."""
+    api = MagicMirrorApiClient("127.0.0.1", "8080", "key")
+    payload = load_json("module.json")
+    small = json.dumps(payload).encode()
+    copies = EXECUTOR_DECODE_THRESHOLD // len(json.dumps(payload["data"][0])) + 1
+    large = json.dumps({"success": True, "data": payload["data"][:1] * copies})
+    assert len(small) <= EXECUTOR_DECODE_THRESHOLD < len(large)
+
+    assert (await api.decode(small, ModuleResponse.from_dict)).success
+    assert (await api.decode(large.encode(), ModuleResponse.from_dict)).success
+
+    stats = api.decode_stats
+    assert stats.inline == stats.offloaded == 1
+    assert stats.inline_max == stats.inline_last > 0
+    assert stats.offloaded_max == stats.offloaded_last > 0
+
+
+async def test_superseded_brightness_shares_failure() -> None:
+    """Test callers whose value was superseded get the failure of the newest."""
+    api = MagicMirrorApiClient("127.0.0.1", "8080", "key")
+    release = asyncio.Event()
+    sent: list[str] = []
+
+    async def brightness(value: str) -> GenericResponse:
+        sent.append(value)
+        await release.wait()
+        if value == "30":
+            raise TimeoutError
+        return GenericResponse(success=True)
+
+    api.brightness = brightness
+    calls = [asyncio.ensure_future(api.set_brightness(value)) for value in (10, 20, 30)]
+    await asyncio.sleep(0)
+    release.set()
+    first, second, third = await asyncio.gather(*calls, return_exceptions=True)
+
+    assert sent == ["10", "30"]
+    assert first.success
+    assert isinstance(second, TimeoutError)
+    assert isinstance(third, TimeoutError)
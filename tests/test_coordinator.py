@@ -0,0 +1,161 @@
+"""Tests for the MagicMirror coordinator."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import Any
+
+import attr
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.magicmirror.api import MagicMirrorApiClient
+from custom_components.magicmirror.coordinator import MagicMirrorDataUpdateCoordinator
+from custom_components.magicmirror.models import Entity, MagicMirrorData
+from custom_components.magicmirror.scheduler import MagicMirrorFleetScheduler
+
+VALUES = {
+    Entity.MONITOR_STATUS: "on",
+    Entity.BRIGHTNESS: 30,
+    Entity.MODULES: [],
+}
+
+
+@attr.s(auto_attribs=True)
+class InFlight:
+    """Class counting the fetches in flight."""
+
+    current: int = 0
+    peak: int = 0
+
+
+def _fetcher(value: Any, in_flight: InFlight) -> Callable[[], Awaitable[Any]]:
+    """Return a fetcher answering value after yielding to the event loop."""
+
+    async def fetch() -> Any:
+        in_flight.current += 1
+        in_flight.peak = max(in_flight.peak, in_flight.current)
+        try:
+            await asyncio.sleep(0)
+            if isinstance(value, Exception):
+                raise value
+            return value
+        finally:
+            in_flight.current -= 1
+
+    return fetch
+
+
+@pytest.fixture
+def in_flight() -> InFlight:
+    """Return the counter of fetches in flight."""
+    return InFlight()
+
+
+@pytest.fixture
+def coordinator(
+    hass: HomeAssistant, in_flight: InFlight
+) -> MagicMirrorDataUpdateCoordinator:
+    """Return a coordinator with fake fetchers."""
+    coordinator = MagicMirrorDataUpdateCoordinator(
+        hass, MagicMirrorApiClient("127.0.0.1", "8080", "key"), "Mirror"
+    )
+    coordinator.fetchers = {
+        key: _fetcher(value, in_flight) for key, value in VALUES.items()
+    }
+    return coordinator
+
+
+async def test_poll_fetches_endpoints_concurrently(
+    coordinator: MagicMirrorDataUpdateCoordinator, in_flight: InFlight
+) -> None:
+    """Test a poll has every endpoint in flight at once."""
+    fields = await coordinator.async_fetch_fields(list(coordinator.fetchers))
+
+    assert fields == {key.value: value for key, value in VALUES.items()}
+    assert in_flight.peak == len(VALUES)
+    assert in_flight.current == 0
+    assert coordinator.poll_traces[-1].success
+
+
+async def test_failing_endpoint_keeps_previous_value(
+    coordinator: MagicMirrorDataUpdateCoordinator,
+) -> None:
+    """Test a failing endpoint keeps its value while the others update."""
+    coordinator.data = MagicMirrorData(monitor_status="off", brightness=80, modules=[])
+    coordinator.fetchers[Entity.BRIGHTNESS] = _fetcher(
+        UpdateFailed("Failed to fetch brightness"), InFlight()
+    )
+
+    fields = await coordinator.async_fetch_fields(list(coordinator.fetchers))
+
+    assert fields == {
+        Entity.MONITOR_STATUS.value: "on",
+        Entity.BRIGHTNESS.value: 80,
+        Entity.MODULES.value: [],
+    }
+
+
+async def test_poll_fails_when_every_endpoint_fails(
+    coordinator: MagicMirrorDataUpdateCoordinator,
+) -> None:
+    """Test the poll fails when no endpoint answered."""
+    coordinator.fetchers = {
+        key: _fetcher(TimeoutError(), InFlight()) for key in coordinator.fetchers
+    }
+
+    with pytest.raises(UpdateFailed):
+        await coordinator.async_fetch_fields(list(coordinator.fetchers))
+
+
+async def test_verify_waits_for_scheduled_poll(
+    coordinator: MagicMirrorDataUpdateCoordinator,
+) -> None:
+    """Test only a scheduled poll completes the verification of a command."""
+    coordinator.data = MagicMirrorData(monitor_status="off", brightness=80, modules=[])
+    coordinator.async_verify_on_next_poll()
+
+    coordinator.async_apply_delta({Entity.BRIGHTNESS.value: 50})
+    assert coordinator.always_update
+
+    await coordinator.async_refresh()
+    assert not coordinator.always_update
+
+
+async def test_failed_poll_keeps_to_slot(
+    coordinator: MagicMirrorDataUpdateCoordinator,
+) -> None:
+    """Test a failed poll times the next poll to the slot again."""
+    coordinator.scheduler = MagicMirrorFleetScheduler()
+    coordinator.update_interval = timedelta(seconds=1)
+    coordinator.fetchers = {
+        key: _fetcher(TimeoutError(), InFlight()) for key in coordinator.fetchers
+    }
+
+    await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert coordinator.update_interval >= coordinator.poll_interval / 2
+
+
+async def test_only_scheduled_polls_wait_for_slot(
+    coordinator: MagicMirrorDataUpdateCoordinator,
+) -> None:
+    """Test first and partial refreshes do not wait for a fleet poll slot."""
+    scheduler = coordinator.scheduler = MagicMirrorFleetScheduler(max_concurrent=1)
+
+    async with scheduler.async_poll():
+        await asyncio.wait_for(coordinator.async_refresh(), 1)
+        assert coordinator.last_update_success
+        await asyncio.wait_for(coordinator.async_fetch_fields([Entity.BRIGHTNESS]), 1)
+
+        poll = asyncio.ensure_future(coordinator.async_refresh())
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert scheduler.stats.waiting == 1
+        assert not poll.done()
+
+    await poll
+    assert coordinator.last_update_success
+    assert scheduler.stats.max_waiting == 1
@@ -0,0 +1,240 @@
+"""Tests for the MagicMirror models."""
+
+import os
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+import attr
+import pytest
+
+from custom_components.magicmirror.models import (
+    GenericResponse,
+    MagicMirrorData,
+    MagicMirrorUpdateData,
+    ModuleDataResponse,
+    ModuleResponse,
+    ModuleUpdateResponse,
+    MonitorResponse,
+    Query,
+    QueryResponse,
+    _compact,
+    _intern,
+)
+from tests.conftest import load_json
+
+MODULE_COUNT = 200
+LOOKUPS = 100
+DECODES = 1000
+
+# Set to print how long the lookups and the decoders take, old against new
+BENCHMARK = bool(os.environ.get("MAGICMIRROR_BENCHMARK"))
+
+
+def _decode_module(data: dict[str, Any]) -> ModuleDataResponse:
+    """Decode a module field by field, as before the schemas."""
+    return ModuleDataResponse(
+        index=data.get("index"),
+        identifier=_intern(data.get("identifier")),
+        name=_intern(data.get("name")),
+        path=_intern(data.get("path")),
+        file=_intern(data.get("file")),
+        configDeepMerge=bool(data.get("configDeepMerge")),
+        classes=_intern(data.get("classes")),
+        hidden=bool(data.get("hidden")),
+        header=_intern(data.get("header")),
+        lockStrings=data.get("lockStrings"),
+        config_json=_compact(data.get("config")),
+        actions_json=_compact(data.get("actions")),
+    )
+
+
+def _decode_modules(data: dict[str, Any]) -> ModuleResponse:
+    """Decode a module response field by field, as before the schemas."""
+    return ModuleResponse(
+        success=bool(data.get("success")),
+        data=[_decode_module(module) for module in data.get("data")],
+    )
+
+
+def _decode_monitor(data: dict[str, Any]) -> MonitorResponse:
+    """Decode a monitor response field by field, as before the schemas."""
+    return MonitorResponse(
+        success=bool(data.get("success")), monitor=data.get("monitor")
+    )
+
+
+def _decode_query(data: dict[str, Any]) -> QueryResponse:
+    """Decode a query response field by field, as before the schemas."""
+    return QueryResponse(
+        success=bool(data.get("success")),
+        result=data.get("result"),
+        query=Query(data=data.get("query").get("data")),
+    )
+
+
+def _decode_generic(data: dict[str, Any]) -> GenericResponse:
+    """Decode a generic response field by field, as before the schemas."""
+    return GenericResponse(success=bool(data.get("success")))
+
+
+FIXTURES = [
+    ("module.json", ModuleResponse.from_dict, _decode_modules),
+    ("monitor_status.json", MonitorResponse.from_dict, _decode_monitor),
+    ("monitor_on.json", MonitorResponse.from_dict, _decode_monitor),
+    ("monitor_off.json", MonitorResponse.from_dict, _decode_monitor),
+    ("brightness_get.json", QueryResponse.from_dict, _decode_query),
+    ("update.json", QueryResponse.from_dict, _decode_query),
+    ("brightness_set.json", GenericResponse.from_dict, _decode_generic),
+    ("test.json", GenericResponse.from_dict, _decode_generic),
+    ("no_api_key.json", GenericResponse.from_dict, _decode_generic),
+]
+
+
+def _modules() -> list[ModuleDataResponse]:
+    """Return synthetic modules."""
+    return [
+        ModuleDataResponse.from_dict(
+            {
+                "index": index,
+                "identifier": f"module_{index}_synthetic{index}",
+                "name": f"synthetic{index}",
+                "path": f"modules/synthetic{index}/",
+                "file": f"synthetic{index}.js",
+                "hidden": index % 2 == 0,
+                "config": {"index": index},
+            }
+        )
+        for index in range(MODULE_COUNT)
+    ]
+
+
+def _module_updates() -> list[ModuleUpdateResponse]:
+    """Return synthetic module updates."""
+    return [
+        ModuleUpdateResponse.from_dict(
+            {
+                "module": f"synthetic{index}",
+                "result": False,
+                "remote": "origin",
+                "lsremote": "",
+                "behind": index % 3,
+            }
+        )
+        for index in range(MODULE_COUNT)
+    ]
+
+
+def test_module_index() -> None:
+    """Test modules and module updates are indexed for lookups."""
+    modules = _modules()
+    module_updates = _module_updates()
+    data = MagicMirrorData(monitor_status="on", brightness=30, modules=modules)
+    update_data = MagicMirrorUpdateData(
+        update_available=False, module_updates=module_updates
+    )
+
+    assert data.modules_by_identifier == {
+        module.identifier: module for module in modules
+    }
+    assert update_data.module_updates_by_name == {
+        update.module: update for update in module_updates
+    }
+
+
+def test_module_index_lookup() -> None:
+    """Test lookups return the indexed objects, also after evolving the data."""
+    modules = _modules()
+    module_updates = _module_updates()
+    data = MagicMirrorData(monitor_status="on", brightness=30, modules=modules)
+    update_data = MagicMirrorUpdateData(
+        update_available=False, module_updates=module_updates
+    )
+
+    for module, update in zip(modules, module_updates, strict=True):
+        assert data.modules_by_identifier[module.identifier] is module
+        assert update_data.module_updates_by_name[update.module] is update
+
+    shown = [attr.evolve(module, hidden=False) for module in modules]
+    evolved = attr.evolve(data, modules=shown[1:])
+    assert modules[0].identifier not in evolved.modules_by_identifier
+    for module in shown[1:]:
+        assert evolved.modules_by_identifier[module.identifier] is module
+
+    evolved_updates = attr.evolve(update_data, module_updates=module_updates[:1])
+    assert evolved_updates.module_updates_by_name == {
+        module_updates[0].module: module_updates[0]
+    }
+
+
+@pytest.mark.skipif(not BENCHMARK, reason="set MAGICMIRROR_BENCHMARK to run")
+def test_module_lookup_benchmark() -> None:
+    """Benchmark a poll's entity lookups against the scans they replaced."""
+    modules = _modules()
+    module_updates = _module_updates()
+
+    def scan() -> None:
+        for module in modules:
+            next(m for m in modules if m.identifier == module.identifier)
+            next(u for u in module_updates if u.module == module.name)
+
+    def index() -> None:
+        data = MagicMirrorData(monitor_status="on", brightness=30, modules=modules)
+        update_data = MagicMirrorUpdateData(
+            update_available=False, module_updates=module_updates
+        )
+        for module in modules:
+            data.modules_by_identifier.get(module.identifier)
+            update_data.module_updates_by_name.get(module.name)
+
+    scan_time = min(timeit.repeat(scan, number=LOOKUPS))
+    index_time = min(timeit.repeat(index, number=LOOKUPS))
+    print(  # noqa: T201
+        f"{MODULE_COUNT} modules: scan {scan_time / LOOKUPS * 1e3:.2f} ms, "
+        f"index {index_time / LOOKUPS * 1e3:.2f} ms per poll, "
+        "including building the index"
+    )
+
+
+@pytest.mark.parametrize(("name", "schema", "decode"), FIXTURES)
+def test_schema_decodes_like_fields(
+    name: str,
+    schema: Callable[[dict[str, Any]], Any],
+    decode: Callable[[dict[str, Any]], Any],
+) -> None:
+    """Test the schema decoders match field-by-field decoding of the fixtures."""
+    data = load_json(name)
+
+    assert schema(data) == decode(data)
+
+
+@pytest.mark.skipif(not BENCHMARK, reason="set MAGICMIRROR_BENCHMARK to run")
+@pytest.mark.parametrize(("name", "schema", "decode"), FIXTURES)
+def test_schema_decode_benchmark(
+    name: str,
+    schema: Callable[[dict[str, Any]], Any],
+    decode: Callable[[dict[str, Any]], Any],
+) -> None:
+    """Benchmark the schema decoders against field-by-field decoding."""
+    data = load_json(name)
+
+    schema_time = min(timeit.repeat(lambda: schema(data), number=DECODES))
+    decode_time = min(timeit.repeat(lambda: decode(data), number=DECODES))
+    print(  # noqa: T201
+        f"{name}: schema {schema_time / DECODES * 1e6:.1f} us, "
+        f"fields {decode_time / DECODES * 1e6:.1f} us per decode"
+    )
+
+
+def test_snapshot_leaves_module_blobs() -> None:
+    """Test the snapshot keeps the rendered module fields but not the blobs."""
+    data = MagicMirrorData(monitor_status="on", brightness=30, modules=_modules())
+
+    snapshot = data.as_dict()
+    restored = MagicMirrorData.from_dict(snapshot)
+
+    assert all("config" not in module for module in snapshot["modules"])
+    assert all("actions" not in module for module in snapshot["modules"])
+    for module in data.modules:
+        rendered = attr.evolve(module, config_json=None, actions_json=None)
+        assert restored.modules_by_identifier[module.identifier] == rendered
@@ -0,0 +1,60 @@
+"""Tests for the MagicMirror notification queue."""
+
+import asyncio
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.magicmirror.notification_queue import (
+    MagicMirrorNotificationQueue,
+)
+
+
+class BlockingApi:
+    """Stand-in API client holding every alert until released."""
+
+    base_url = "http://127.0.0.1:8080"
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.sending = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def alert(self, **_: Any) -> dict[str, Any]:
+        """Wait until released, then accept the alert."""
+        self.sending.set()
+        await self.release.wait()
+        return {"success": True}
+
+
+async def test_close_fails_alert_being_sent(hass: HomeAssistant) -> None:
+    """Test closing resolves the alert the worker was sending."""
+    api = BlockingApi()
+    queue = MagicMirrorNotificationQueue(hass, api)
+
+    future = queue.enqueue("Title", "Message", 5)
+    await api.sending.wait()
+    await queue.async_close()
+
+    assert await asyncio.wait_for(future, 1) is False
+
+
+async def test_close_keeps_worker_started_after_it(hass: HomeAssistant) -> None:
+    """Test a cancelled worker does not clear the worker that replaced it."""
+    api = BlockingApi()
+    queue = MagicMirrorNotificationQueue(hass, api)
+
+    queue.enqueue("Title", "First", 5)
+    await api.sending.wait()
+    cancelled = queue._worker  # noqa: SLF001
+    await queue.async_close()
+
+    future = queue.enqueue("Title", "Second", 5)
+    worker = queue._worker  # noqa: SLF001
+    await asyncio.wait([cancelled])
+
+    assert queue._worker is worker  # noqa: SLF001
+    api.release.set()
+    assert await asyncio.wait_for(future, 1) is True
+    await hass.async_block_till_done()
+    assert queue._worker is None  # noqa: SLF001
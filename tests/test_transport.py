@@ -0,0 +1,142 @@
+"""Tests for the MagicMirror socket transport."""
+
+from collections.abc import AsyncGenerator
+
+import aiohttp
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.magicmirror import transport
+from custom_components.magicmirror.api import CommandLatency, MagicMirrorApiClient
+from custom_components.magicmirror.transport import MagicMirrorSocketTransport
+from tests.conftest import StandInMirror
+
+COMMANDS = 50
+MODULE = "module_0_alert"
+
+
+@pytest.fixture
+async def session() -> AsyncGenerator[aiohttp.ClientSession, None]:
+    """Return a client session."""
+    async with aiohttp.ClientSession() as session:
+        yield session
+
+
+def _client(
+    hass: HomeAssistant,
+    mirror: StandInMirror,
+    session: aiohttp.ClientSession,
+    *,
+    socket: bool,
+) -> MagicMirrorApiClient:
+    """Return a client of the stand-in mirror, with or without the socket."""
+    return MagicMirrorApiClient(
+        mirror.host,
+        mirror.port,
+        "key",
+        session,
+        MagicMirrorSocketTransport(hass, session, mirror.base_url) if socket else None,
+    )
+
+
+async def _measure(api: MagicMirrorApiClient, transport: str) -> CommandLatency:
+    """Send commands after a warm-up, returning their latency."""
+    assert (await api.show_module(MODULE)).success
+    api.command_latency[transport] = CommandLatency()
+
+    for _ in range(COMMANDS):
+        assert (await api.hide_module(MODULE)).success
+
+    return api.command_latency[transport]
+
+
+async def test_command_latency_by_transport(
+    hass: HomeAssistant,
+    stand_in_mirror: StandInMirror,
+    session: aiohttp.ClientSession,
+) -> None:
+    """Compare per-command round trips of the socket and HTTP against a stand-in."""
+    http_api = _client(hass, stand_in_mirror, session, socket=False)
+    socket_api = _client(hass, stand_in_mirror, session, socket=True)
+
+    http = await _measure(http_api, "http")
+    socket = await _measure(socket_api, "socket")
+    await socket_api.async_close()
+
+    assert http.count == socket.count == COMMANDS
+    assert stand_in_mirror.http_actions == ["show"] + ["hide"] * COMMANDS
+    assert socket_api.command_latency["http"].count == 0
+    assert socket.average < http.average
+    assert (
+        stand_in_mirror.socket_actions
+        == [{"action": "SHOW", "module": MODULE}]
+        + [{"action": "HIDE", "module": MODULE}] * COMMANDS
+    )
+
+
+async def test_socket_reply_is_returned(
+    hass: HomeAssistant,
+    stand_in_mirror: StandInMirror,
+    session: aiohttp.ClientSession,
+) -> None:
+    """Test a command rejected over the socket is not retried over HTTP."""
+    stand_in_mirror.socket_reply = {"success": False}
+    api = _client(hass, stand_in_mirror, session, socket=True)
+
+    assert not (await api.hide_module(MODULE)).success
+    await api.async_close()
+
+    assert stand_in_mirror.http_actions == []
+    assert api.command_latency["socket"].count == 1
+
+
+async def test_result_of_other_action_is_ignored(
+    hass: HomeAssistant,
+    stand_in_mirror: StandInMirror,
+    session: aiohttp.ClientSession,
+) -> None:
+    """Test a broadcast result naming another action is not taken as the reply."""
+    stand_in_mirror.socket_broadcasts = [{"success": False, "action": "SHOW"}]
+    api = _client(hass, stand_in_mirror, session, socket=True)
+
+    assert (await api.hide_module(MODULE)).success
+    await api.async_close()
+
+    assert stand_in_mirror.http_actions == []
+
+
+async def test_not_resent_over_http_without_reply(
+    hass: HomeAssistant,
+    stand_in_mirror: StandInMirror,
+    session: aiohttp.ClientSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a command sent over the socket is not resent when the reply is late."""
+    monkeypatch.setattr(transport, "COMMAND_TIMEOUT", 0.1)
+    stand_in_mirror.socket_reply = None
+    api = _client(hass, stand_in_mirror, session, socket=True)
+
+    assert (await api.hide_module(MODULE)).success
+    assert (await api.show_module(MODULE)).success
+    await api.async_close()
+
+    assert stand_in_mirror.socket_actions == [{"action": "HIDE", "module": MODULE}]
+    assert stand_in_mirror.http_actions == ["show"]
+    assert api.command_latency["socket"].count == 0
+
+
+async def test_falls_back_to_http(
+    hass: HomeAssistant,
+    stand_in_mirror: StandInMirror,
+    session: aiohttp.ClientSession,
+) -> None:
+    """Test commands are sent over HTTP when the socket cannot connect."""
+    stand_in_mirror.socket_enabled = False
+    api = _client(hass, stand_in_mirror, session, socket=True)
+
+    assert (await api.hide_module(MODULE)).success
+    await api.async_close()
+
+    assert stand_in_mirror.http_actions == ["hide"]
+    assert api.command_latency["socket"].count == 0
+    assert api.command_latency["http"].count == 1